@@ -0,0 +1,64 @@
+# times inserting lifeforms one statement (and one commit) at a time vs LifeformRepository.add_many
+# run with: python benchmarks/bench_bulk_insert.py [--rows 100000] [--single-rows 2000] [--chunk-size 5000]
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtSql import QSqlDatabase, QSqlQuery
+from migrations import migrate
+from repository import LifeformRecord, LifeformRepository, INSERT_SQL
+from lookups import LIFE_FORMS, SHOTS, CLONE_EYES, SP_WEAPONS, RATINGS
+
+def records(rows, seed=0):
+    rng = random.Random(seed)
+    for i in range(rows):
+        yield LifeformRecord(rng.choice(list(LIFE_FORMS)), rng.choice(list(SHOTS)), rng.choice(list(SHOTS)),
+                             rng.choice(list(CLONE_EYES)), rng.choice(list(SP_WEAPONS)), rng.choice(list(RATINGS)), f"run {i}")
+
+def open_database(path):
+    database = QSqlDatabase.addDatabase("QSQLITE", os.path.basename(path))
+    database.setDatabaseName(path)
+    database.open()
+    migrate(database)
+    return database
+
+def single_inserts(database, rows): # what add_lifeform does per click, each insert is its own transaction
+    query = QSqlQuery(database)
+    for record in records(rows):
+        query.prepare(INSERT_SQL)
+        for value in record:
+            query.addBindValue(value)
+        query.exec()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--single-rows", type=int, default=2000, help="the one-at-a-time path is timed on fewer rows and scaled up")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as folder:
+        database = open_database(os.path.join(folder, "single.db"))
+        start = time.perf_counter()
+        single_inserts(database, args.single_rows)
+        single = time.perf_counter() - start
+        database.close()
+
+        database = open_database(os.path.join(folder, "batch.db"))
+        start = time.perf_counter()
+        inserted = LifeformRepository(database).add_many(records(args.rows), chunk_size=args.chunk_size)
+        batch = time.perf_counter() - start
+        database.close()
+
+    print(f"single inserts  {args.single_rows:>8} rows {single:8.2f}s   ~{single / args.single_rows * args.rows:8.1f}s for {args.rows} rows")
+    print(f"add_many        {inserted:>8} rows {batch:8.2f}s   {inserted / batch:10.0f} rows/s (chunks of {args.chunk_size})")
+
+if __name__ == "__main__":
+    main()
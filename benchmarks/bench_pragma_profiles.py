@@ -0,0 +1,73 @@
+# compares the PRAGMA profiles from pragmas.py on single row adds, bulk inserts and paging through the table
+# run with: python benchmarks/bench_pragma_profiles.py [--rows 100000] [--single-rows 1000] [--profiles tuned default]
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtSql import QSqlQuery
+from migrations import migrate
+from repository import LifeformRepository
+from pragmas import Connection, PROFILES
+from queries import page_sql
+from table_model import PAGE_SIZE
+from bench_bulk_insert import records, single_inserts
+
+def read_pages(database): # what scrolling to the bottom of the table does, one keyset page at a time
+    query = QSqlQuery(database)
+    query.setForwardOnly(True)
+    last_id = 0
+    rows = 0
+    while True:
+        query.prepare(page_sql())
+        query.addBindValue(last_id)
+        query.addBindValue(PAGE_SIZE)
+        query.exec()
+        page = 0
+        while query.next():
+            last_id = query.value(0)
+            query.value(7)
+            page += 1
+        rows += page
+        if page < PAGE_SIZE:
+            return rows
+
+def run_profile(folder, profile, rows, single_rows):
+    with Connection(os.path.join(folder, f"{profile}.db"), profile, profile) as connection:
+        migrate(connection.database)
+
+        start = time.perf_counter()
+        single_inserts(connection.database, single_rows)
+        single = single_rows / (time.perf_counter() - start)
+
+        repository = LifeformRepository(connection.database)
+        start = time.perf_counter()
+        repository.add_many(records(rows))
+        bulk = rows / (time.perf_counter() - start)
+        repository.close()
+
+        start = time.perf_counter()
+        read = read_pages(connection.database) / (time.perf_counter() - start)
+    return connection.pragmas, single, bulk, read
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--single-rows", type=int, default=1000, help="adds that each commit on their own, like clicking Add Life Form")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    print(f"{'profile':<10}{'single adds/s':>15}{'bulk rows/s':>15}{'read rows/s':>15}   settings")
+    with tempfile.TemporaryDirectory() as folder:
+        for profile in args.profiles:
+            pragmas, single, bulk, read = run_profile(folder, profile, args.rows, args.single_rows)
+            settings = " ".join(f"{pragma}={value}" for pragma, value in pragmas.items())
+            print(f"{profile:<10}{single:>15.0f}{bulk:>15.0f}{read:>15.0f}   {settings}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# times the Runs tab queries (best scores, latest runs of a build) and logging a run as the runs table grows
+# run with: python benchmarks/bench_run_log.py [--runs 1000 10000 100000 500000] [--repeat 500]
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from PySide6.QtCore import QCoreApplication
+from migrations import SCHEMA
+from pragmas import Connection
+from repository import LifeformRepository, RunRecord
+from combos import BUILDS
+
+CONNECTION_NAME = "bench"
+
+def seed(path, runs): # fills runs with sqlite3 directly, spread over a year and favouring a few hundred builds
+    rng = random.Random(0)
+    favourites = rng.sample(range(BUILDS), 300)
+    connection = sqlite3.connect(path)
+    for statement in SCHEMA:
+        connection.execute(statement)
+    start = time.time() - 365 * 86400
+    rows = ((rng.choice(favourites) if rng.random() < 0.8 else rng.randrange(BUILDS),
+             time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(start + i * 365 * 86400 / runs)),
+             rng.randint(10000, 5000000), rng.randint(1, 6), rng.randint(60, 1800)) for i in range(runs))
+    connection.executemany("INSERT INTO runs (build, played_at, score, stage, seconds) VALUES (?, ?, ?, ?, ?)", rows)
+    connection.commit()
+    connection.close()
+
+def timed(call, repeat): # (median, worst) in ms
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        call(i)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), max(times)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, nargs="+", default=[1000, 10000, 100000, 500000])
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    rng = random.Random(1)
+    print(f"{'runs':>9}  {'top 10':>17}  {'latest 20':>17}  {'log run':>17}   (median / worst ms)")
+    with tempfile.TemporaryDirectory() as folder:
+        for runs in args.runs:
+            path = os.path.join(folder, f"runs_{runs}.db")
+            seed(path, runs)
+            with Connection(path, CONNECTION_NAME, 'tuned') as connection:
+                repository = LifeformRepository(connection.database)
+                builds = [rng.randrange(BUILDS) for _ in range(args.repeat)]
+                results = [
+                    timed(lambda i: repository.top_runs(), args.repeat),
+                    timed(lambda i: repository.recent_runs(builds[i]), args.repeat),
+                    timed(lambda i: repository.log_run(RunRecord(builds[i], rng.randint(10000, 5000000), 3, 600)), args.repeat),
+                ]
+                repository.close()
+            print(f"{runs:>9,}  " + "  ".join(f"{median:7.3f} / {worst:7.3f}" for median, worst in results))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# times the worker's add/update/remove/page statements prepared on every call vs reused from a StatementCache
+# run with: python benchmarks/bench_statement_cache.py [--operations 5000]
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtSql import QSqlQuery
+from migrations import migrate
+from pragmas import Connection
+from queries import page_sql, search_filter
+from repository import INSERT_SQL
+from statements import StatementCache
+
+UPDATE_SQL = "UPDATE lifeforms SET life_form = ?, main_shot = ?, option_shot = ?, clone_eyes = ?, sp_weapon = ?, rating = ?, notes = ? WHERE id = ?"
+DELETE_SQL = "DELETE FROM lifeforms WHERE id = ?"
+
+def uncached_run(database, sql, values): # what the worker did before, a new query and a prepare per statement
+    query = QSqlQuery(database)
+    query.setForwardOnly(True)
+    query.prepare(sql)
+    for value in values:
+        query.addBindValue(value)
+    query.exec()
+    return query
+
+def workload(run, operations): # one click's worth of SQL per operation: an add, an update, a search page and every other time a remove
+    where, values = search_filter(2, 3)
+    for i in range(operations):
+        query = run(INSERT_SQL, (2, 0, 1, 0, 0, 3, f"run {i}"))
+        id = query.lastInsertId()
+        run(UPDATE_SQL, (2, 1, 1, 0, 0, 3, f"run {i}", id))
+        query = run(page_sql(where), values + [max(id - 20, 0), 256])
+        while query.next():
+            pass
+        query.finish()
+        if i % 2:
+            run(DELETE_SQL, (id,))
+
+def timed(folder, name, make_run, operations):
+    with Connection(os.path.join(folder, f"{name}.db"), name, 'tuned') as connection:
+        migrate(connection.database)
+        run, cache = make_run(connection.database)
+        start = time.perf_counter()
+        workload(run, operations)
+        seconds = time.perf_counter() - start
+        stats = ""
+        if cache is not None:
+            stats = cache.stats()
+            cache.clear()
+        del run, cache # both hold on to the connection
+    return seconds, stats
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--operations", type=int, default=5000)
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as folder:
+        uncached, _ = timed(folder, "uncached", lambda database: (lambda sql, values: uncached_run(database, sql, values), None), args.operations)
+        def cached_run(database):
+            cache = StatementCache(database)
+            return cache.run, cache
+        cached, stats = timed(folder, "cached", cached_run, args.operations)
+
+    statements = args.operations * 3 + args.operations // 2
+    print(f"prepare every time {uncached:8.2f}s   {uncached / statements * 1e6:6.1f} us/statement")
+    print(f"statement cache    {cached:8.2f}s   {cached / statements * 1e6:6.1f} us/statement   {stats}")
+
+if __name__ == "__main__":
+    main()
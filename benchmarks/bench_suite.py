@@ -0,0 +1,197 @@
+# times the main window's refresh, search, add, update and delete end to end (click -> worker -> table updated)
+# on seeded databases of different sizes, and writes the results as JSON so runs can be compared
+# run with: python benchmarks/bench_suite.py [--rows 1000 10000 100000 1000000] [--repeat 20] [--baseline old.json]
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import PySide6
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtSql import QSqlDatabase, QSqlQuery
+from migrations import migrate
+from pragmas import Connection, DEFAULT_PROFILE
+from generator import generate, NOTE_WORDS as WORDS
+from main import MainWindow, DATABASE_FILE
+
+RESULTS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+TIMEOUT_MS = 60000 # a step that takes longer than this is reported as failed instead of hanging the run
+
+def seed(path, rows): # a migrated database with rows of realistic synthetic data, see generator.py
+    with Connection(path, "seed", DEFAULT_PROFILE) as connection:
+        migrate(connection.database)
+        generate(connection.database, rows, seed=rows)
+
+def sqlite_version(): # the SQLite built into the QSQLITE driver the app uses, Python's sqlite3 module can be a different one
+    with Connection(":memory:", "version") as connection:
+        query = QSqlQuery("SELECT sqlite_version()", connection.database)
+        query.next()
+        return query.value(0)
+
+def timed(signal, action): # runs action and waits for signal, returns the milliseconds in between (None if it never came)
+    loop = QEventLoop()
+    arrived = []
+    def done(*args):
+        arrived.append(True)
+        loop.quit()
+    signal.connect(done)
+    QTimer.singleShot(TIMEOUT_MS, loop.quit)
+    start = time.perf_counter()
+    action()
+    if not arrived:
+        loop.exec()
+    elapsed = (time.perf_counter() - start) * 1000
+    signal.disconnect(done)
+    return elapsed if arrived else None
+
+def operations(window): # name -> (signal that ends it, what to click)
+    def search_life_form():
+        window.box_search_life_forms.setCurrentIndex(random.randrange(1, 7))
+        window.box_search_rating.setCurrentIndex(0)
+        window.line_search_notes.clear()
+        window.search_lifeform()
+
+    def search_life_form_rating():
+        window.box_search_life_forms.setCurrentIndex(random.randrange(1, 7))
+        window.box_search_rating.setCurrentIndex(random.randrange(1, 4))
+        window.line_search_notes.clear()
+        window.search_lifeform()
+
+    def search_notes():
+        window.box_search_life_forms.setCurrentIndex(0)
+        window.box_search_rating.setCurrentIndex(0)
+        window.line_search_notes.setText(random.choice(WORDS)[:4])
+        window.search_lifeform()
+
+    def add():
+        window.tabWidget.setCurrentIndex(random.randrange(6))
+        window.line_notes.setText(" ".join(random.choices(WORDS, k=3)))
+        window.add_lifeform()
+
+    def update(): # a new build and rating from the form over row 0, so the row and the stats really change
+        window.table.selectRow(0)
+        window.tabWidget.setCurrentIndex(random.randrange(6))
+        window.box_main_shot.setCurrentIndex(random.randrange(4))
+        window.box_rating.setCurrentIndex(random.randrange(3))
+        window.update_lifeform()
+
+    def delete():
+        window.table.selectRow(0)
+        window.remove_lifeform()
+
+    first_page = window.model.first_page_loaded
+    return {
+        'refresh': (first_page, window.query_db),
+        'search_life_form': (first_page, search_life_form),
+        'search_life_form_rating': (first_page, search_life_form_rating),
+        'search_notes': (first_page, search_notes),
+        'add': (window.worker.added, add),
+        'update': (window.worker.updated, update),
+        'delete': (window.worker.removed, delete),
+    }
+
+def summary(times):
+    ordered = sorted(times)
+    return {
+        'median_ms': statistics.median(ordered),
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        'min_ms': ordered[0],
+        'max_ms': ordered[-1],
+    }
+
+def run_size(rows, repeat):
+    results = []
+    working_folder = os.getcwd() # so relative --output and --baseline paths still mean the folder the run was started from
+    with tempfile.TemporaryDirectory() as folder:
+        os.chdir(folder) # the window opens wonder_lifeforms.db and settings.ini in the working folder
+        start = time.perf_counter()
+        seed(DATABASE_FILE, rows)
+        print(f"{rows:>9,} rows seeded in {time.perf_counter() - start:.1f}s")
+
+        window = MainWindow()
+        window.show()
+        timed(window.model.first_page_loaded, lambda: None) # the first page from startup
+        for name, (signal, action) in operations(window).items():
+            if name in ('update', 'delete'):
+                window.query_db() # so row 0 is a real row again after the searches
+                timed(window.model.first_page_loaded, lambda: None)
+            times = [timed(signal, action) for _ in range(repeat)]
+            if None in times:
+                print(f"{'':>9} {name:<24} timed out")
+                results.append({'rows': rows, 'operation': name, 'repeat': repeat, 'failed': True})
+                continue
+            result = {'rows': rows, 'operation': name, 'repeat': repeat, **summary(times)}
+            results.append(result)
+            print(f"{'':>9} {name:<24} median {result['median_ms']:8.2f} ms   p95 {result['p95_ms']:8.2f} ms")
+        window.close()
+        del window.database # the next window makes the default connection again
+        window.deleteLater()
+        QApplication.processEvents()
+        QSqlDatabase.removeDatabase("qt_sql_default_connection")
+        os.chdir(working_folder)
+    return results
+
+def regressions(results, baseline_path, tolerance): # operations whose median got slower than the baseline by more than tolerance
+    with open(baseline_path, encoding='utf-8') as file:
+        baseline = {(result['rows'], result['operation']): result for result in json.load(file)['results']}
+    slower = []
+    for result in results:
+        old = baseline.get((result['rows'], result['operation']))
+        if old is None or 'median_ms' not in old:
+            continue
+        if result.get('failed') or result['median_ms'] > old['median_ms'] * (1 + tolerance):
+            slower.append((result, old))
+    return slower
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="where to write the JSON results (default: benchmarks/results/suite-<time>.json)")
+    parser.add_argument("--baseline", help="an earlier results file, exits with 1 if any operation got slower")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="how much slower than the baseline still passes (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    # the confirmation boxes would block the run, every question gets a yes
+    QMessageBox.question = staticmethod(lambda *_args, **_kwargs: QMessageBox.StandardButton.Yes)
+    random.seed(0)
+
+    results = []
+    for rows in args.rows:
+        results += run_size(rows, args.repeat)
+
+    report = {
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'pyside6': PySide6.__version__,
+        'sqlite': sqlite_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+    output = args.output or os.path.join(RESULTS_FOLDER, f"suite-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f"results written to {output}")
+
+    if args.baseline:
+        slower = regressions(results, args.baseline, args.tolerance)
+        for result, old in slower:
+            now = "timed out" if result.get('failed') else f"{result['median_ms']:.2f} ms"
+            print(f"SLOWER {result['rows']:>9,} rows {result['operation']:<24} {old['median_ms']:.2f} ms -> {now}")
+        return 1 if slower else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# times loading the lifeforms table into the results view, the old per-row QTableWidget way vs the table model
+# run with: python benchmarks/bench_table_load.py [--rows 1000 10000 100000] [--legacy-limit 1000]
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from PySide6.QtCore import QEventLoop, QMetaObject, QThread, Qt
+from PySide6.QtWidgets import QApplication, QTableView, QTableWidget, QTableWidgetItem
+from PySide6.QtSql import QSqlDatabase, QSqlQuery
+from table_model import LifeformTableModel, SAMPLE_ROWS
+from worker import DatabaseWorker
+from migrations import SCHEMA
+from lookups import LIFE_FORMS, SHOTS, CLONE_EYES, SP_WEAPONS, RATINGS
+
+def seed(path, rows):
+    rng = random.Random(rows)
+    connection = sqlite3.connect(path)
+    for statement in SCHEMA:
+        connection.execute(statement)
+    codes = [list(LIFE_FORMS), list(SHOTS), list(SHOTS), list(CLONE_EYES), list(SP_WEAPONS), list(RATINGS)]
+    connection.executemany("INSERT INTO lifeforms (life_form, main_shot, option_shot, clone_eyes, sp_weapon, rating, notes) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                           ((*[rng.choice(column) for column in codes], f"run {i}") for i in range(rows)))
+    connection.commit()
+    connection.close()
+
+def legacy_load(table): # what query_db + populate_table used to do
+    table.setRowCount(0)
+    query = QSqlQuery("SELECT * FROM lifeforms")
+    row = 0
+    while query.next():
+        table.setColumnCount(8)
+        table.setHorizontalHeaderLabels(['ID','Life Form','Main Shot','Option Shot','Clone Eyes','Special Weapon','Rating','Notes'])
+        table.insertRow(row)
+        table.setItem(row, 0, QTableWidgetItem('  '+str(query.value(0))+'  '))
+        for column in range(1, 8):
+            table.setItem(row, column, QTableWidgetItem('  '+str(query.value(column))+'  '))
+        table.resizeColumnsToContents()
+        table.resizeRowsToContents()
+        row += 1
+
+def model_load(view, model): # what query_db does now, the worker reads only the first page until the view scrolls
+    loop = QEventLoop()
+    model.first_page_loaded.connect(loop.quit)
+    model.set_filter()
+    loop.exec()
+    model.first_page_loaded.disconnect(loop.quit)
+    view.horizontalHeader().setResizeContentsPrecision(SAMPLE_ROWS)
+    view.resizeColumnsToContents()
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    QApplication.processEvents()
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--legacy-limit", type=int, default=1000, help="skip the old path above this many rows (it grows quadratically, 1k rows already takes over a minute)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    database = QSqlDatabase.addDatabase("QSQLITE")
+    with tempfile.TemporaryDirectory() as folder:
+        for rows in args.rows:
+            path = os.path.join(folder, f"bench_{rows}.db")
+            seed(path, rows)
+            database.setDatabaseName(path)
+            database.open()
+
+            if rows <= args.legacy_limit:
+                table = QTableWidget()
+                table.show()
+                before = f"{timed(legacy_load, table):8.2f}s"
+                table.close()
+            else:
+                before = "  skipped"
+
+            thread = QThread()
+            worker = DatabaseWorker(path)
+            worker.moveToThread(thread)
+            thread.started.connect(worker.open)
+            thread.start()
+
+            view = QTableView()
+            model = LifeformTableModel(view)
+            model.page_requested.connect(worker.fetch_page)
+            worker.page_ready.connect(model.add_page)
+            view.setModel(model)
+            view.show()
+            after = f"{timed(model_load, view, model):8.2f}s"
+            view.close()
+
+            QMetaObject.invokeMethod(worker, "close", Qt.ConnectionType.BlockingQueuedConnection)
+            thread.quit()
+            thread.wait()
+
+            print(f"{rows:>8} rows   before {before}   after {after}")
+            database.close()
+    connection_name = database.connectionName()
+    del database
+    QSqlDatabase.removeDatabase(connection_name)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# makes sure every search filter combination is answered from an index and never needs a full scan or a sort,
+# and that the Runs tab queries walk their indexes without sorting
+# run with: python benchmarks/check_query_plans.py
+import itertools
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from queries import page_sql, search_filter
+from migrations import SCHEMA
+from repository import TOP_RUNS_SQL, RECENT_RUNS_SQL
+
+LIFE_FORMS = [None, 5] # All, Redlichia Rex
+RATINGS = [None, 3] # Any, 3: Great
+
+def main():
+    connection = sqlite3.connect(":memory:")
+    for statement in SCHEMA:
+        connection.execute(statement)
+
+    failures = 0
+    for life_form, rating in itertools.product(LIFE_FORMS, RATINGS):
+        where, values = search_filter(life_form, rating)
+        plan = [row[3] for row in connection.execute("EXPLAIN QUERY PLAN " + page_sql(where), values + [0, 256])]
+        ok = all(step.startswith("SEARCH") and ("INDEX" in step or "PRIMARY KEY" in step) for step in plan)
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} life_form={life_form!s:<5} rating={rating!s:<5} {' | '.join(plan)}")
+
+    # these two read in index order and stop at the LIMIT, a temp b-tree would mean sorting every run first
+    for name, sql, values in (("top runs", TOP_RUNS_SQL, [10]), ("recent runs", RECENT_RUNS_SQL, [0, 20])):
+        plan = [row[3] for row in connection.execute("EXPLAIN QUERY PLAN " + sql, values)]
+        ok = all("INDEX" in step and "TEMP B-TREE" not in step for step in plan)
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {name:<29} {' | '.join(plan)}")
+
+    connection.close()
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+from array import array
+from lookups import LIFE_FORMS, SHOTS, CLONE_EYES, SP_WEAPONS
+
+# a build is (life_form, main_shot, option_shot, clone_eyes, sp_weapon), packed into one int as a mixed radix number
+# life_form is the most significant digit, so each life form owns one block of BUILDS_PER_LIFE_FORM numbers
+
+RADIX = (len(LIFE_FORMS), len(SHOTS), len(SHOTS), len(CLONE_EYES), len(SP_WEAPONS)) # 6, 4, 4, 6, 6
+BUILDS = RADIX[0] * RADIX[1] * RADIX[2] * RADIX[3] * RADIX[4] # 3,456
+BUILDS_PER_LIFE_FORM = BUILDS // RADIX[0] # 576
+BUILD_COLUMNS = ('life_form', 'main_shot', 'option_shot', 'clone_eyes', 'sp_weapon')
+
+def packed_build_sql(): # the same packing done by SQLite, and a WHERE clause that skips rows with missing or unknown codes
+    packed = BUILD_COLUMNS[0]
+    for column, radix in zip(BUILD_COLUMNS[1:], RADIX[1:]):
+        packed = f"({packed}) * {radix} + {column}"
+    known = " AND ".join(f"{column} BETWEEN 0 AND {radix - 1}" for column, radix in zip(BUILD_COLUMNS, RADIX))
+    return packed, known
+
+def combo_stats_sql(): # (packed build, runs, rated runs, rating total) from the totals the triggers keep (see migrations.py), one row per build tried
+    packed, known = packed_build_sql()
+    return f"SELECT {packed}, runs, bad + good + great, rating_sum FROM combo_stats WHERE {known}"
+
+def pack_build(build): # (life_form, main_shot, option_shot, clone_eyes, sp_weapon) -> 0 ... 3455, or None if a code is missing or unknown
+    code = 0
+    for value, radix in zip(build, RADIX):
+        if value is None or not 0 <= value < radix:
+            return None
+        code = code * radix + value
+    return code
+
+def unpack_build(code): # 0 ... 3455 -> (life_form, main_shot, option_shot, clone_eyes, sp_weapon)
+    build = []
+    for radix in reversed(RADIX):
+        code, value = divmod(code, radix)
+        build.append(value)
+    return tuple(reversed(build))
+
+def neighbor_index(): # for every packed build, the builds of the same life form that differ in exactly one other slot
+    # flat array of NEIGHBORS codes per build, grouped by slot (main shot, option shot, clone eyes, special weapon) and in code order inside each group
+    places = [] # what one step of each slot adds to the packed code, 576, 144, 36, 6, 1
+    place = 1
+    for radix in reversed(RADIX):
+        places.insert(0, place)
+        place *= radix
+    index = array('H')
+    for code in range(BUILDS):
+        build = unpack_build(code)
+        for slot in range(1, len(RADIX)):
+            base = code - build[slot] * places[slot]
+            index.extend(base + value * places[slot] for value in range(RADIX[slot]) if value != build[slot])
+    return index
+
+NEIGHBORS = sum(radix - 1 for radix in RADIX[1:]) # 16 builds one swap away
+NEIGHBOR_SLOTS = [slot for slot in range(1, len(RADIX)) for _ in range(RADIX[slot] - 1)] # which slot each position in a build's block swaps
+NEIGHBOR_INDEX = neighbor_index() # 3,456 x 16 codes, built once (about 30 ms) when the module loads
+
+def neighbors(code): # [(slot, neighbor code)] for a packed build, a slice of the index, nothing is searched
+    start = code * NEIGHBORS
+    return list(zip(NEIGHBOR_SLOTS, NEIGHBOR_INDEX[start:start + NEIGHBORS]))
+
+class CoverageIndex: # which builds have been tried at least once, kept in memory and updated row by row
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.counts = array('I', [0]) * BUILDS # rows logged per build, so deleting one of two runs keeps the build tested
+        self.bitmap = bytearray(BUILDS // 8) # bit n is set while build n has any rows
+        self.tested_counts = [0] * RADIX[0] # set bits per life form, so the totals never need a recount
+
+    def load(self, counts): # rows per packed build (BUILDS numbers, e.g. from np.bincount), replaces everything
+        self.clear()
+        for code, rows in enumerate(counts):
+            if rows > 0:
+                self.counts[code] = rows
+                self.set_bit(code)
+
+    def add(self, build): # takes a LifeformRecord (or any tuple that starts with the build)
+        code = pack_build(build[:5])
+        if code is None:
+            return
+        self.counts[code] += 1
+        if self.counts[code] == 1:
+            self.set_bit(code)
+
+    def remove(self, build):
+        code = pack_build(build[:5])
+        if code is None or self.counts[code] == 0:
+            return
+        self.counts[code] -= 1
+        if self.counts[code] == 0:
+            self.bitmap[code >> 3] &= ~(1 << (code & 7))
+            self.tested_counts[code // BUILDS_PER_LIFE_FORM] -= 1
+
+    def set_bit(self, code):
+        self.bitmap[code >> 3] |= 1 << (code & 7)
+        self.tested_counts[code // BUILDS_PER_LIFE_FORM] += 1
+
+    def is_tested(self, build):
+        code = pack_build(build[:5])
+        return code is not None and bool(self.bitmap[code >> 3] & (1 << (code & 7)))
+
+    def tested(self, life_form=None): # builds tried so far, for one life form or all of them
+        if life_form is None:
+            return sum(self.tested_counts)
+        return self.tested_counts[life_form]
+
+    def untested(self, life_form): # the builds of a life form nobody has tried yet, in code order
+        start = life_form * BUILDS_PER_LIFE_FORM
+        for code in range(start, start + BUILDS_PER_LIFE_FORM):
+            if not self.bitmap[code >> 3] & (1 << (code & 7)):
+                yield unpack_build(code)
@@ -0,0 +1,120 @@
+import csv
+import json
+import os
+import tempfile
+import time
+from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtSql import QSqlQuery
+from repository import LifeformRecord, LifeformRepository, RepositoryError
+from pragmas import Connection, OpenError, DEFAULT_PROFILE
+from lookups import label
+
+CONNECTION_NAME = "export"
+EXPORT_CHUNK_SIZE = 5000 # rows read per query, the only rows ever held in memory
+
+FIELDS = ('id',) + LifeformRecord._fields
+
+def export_format(path): # picked from the file extension
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.db', '.sqlite', '.sqlite3'):
+        return 'sqlite'
+    return 'jsonl'
+
+def read_chunks(repository, chunk_size=EXPORT_CHUNK_SIZE): # walks the table in id order a chunk at a time, yields lists of rows with the codes turned into labels
+    for chunk in repository.iterate(chunk_size):
+        yield [[id] + [label(column, value) for column, value in enumerate(record[:-1])] + [record.notes] for id, record in chunk]
+
+class ExportWorker(QObject): # writes the lifeforms table out to CSV, JSON Lines or a compacted SQLite copy on its own thread
+    progress = Signal(int, int) # rows written, total rows
+    finished = Signal(int, float) # rows written, seconds taken
+    failed = Signal(str)
+
+    def __init__(self, database_file, path, profile=DEFAULT_PROFILE):
+        super().__init__()
+        self.database_file = database_file
+        self.path = path
+        self.profile = profile
+        self.cancelled = False # write_rows stops at the next chunk once cancel() sets this
+
+    def cancel(self):
+        self.cancelled = True
+
+    @Slot()
+    def run(self):
+        if os.path.exists(self.path) and os.path.samefile(self.path, self.database_file):
+            self.failed.emit("That's the database being exported, pick another file to export to.")
+            return
+        try:
+            with Connection(self.database_file, CONNECTION_NAME, self.profile) as connection:
+                self.export(connection.database)
+        except OpenError as error:
+            self.failed.emit(f"Could not open your database\n{error}")
+
+    def export(self, database):
+        repository = LifeformRepository(database)
+        try:
+            self.write(database, repository)
+        finally:
+            repository.close()
+
+    def write(self, database, repository):
+        try:
+            total = repository.count()
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+
+        start = time.perf_counter()
+        try:
+            if export_format(self.path) == 'sqlite':
+                written = self.write_snapshot(database, total)
+            else:
+                written = self.write_rows(repository, total)
+        except (OSError, RepositoryError) as error:
+            self.remove_partial()
+            self.failed.emit(str(error))
+            return
+        if self.cancelled:
+            self.remove_partial()
+        self.finished.emit(written, time.perf_counter() - start)
+
+    def write_rows(self, repository, total):
+        written = 0
+        with open(self.path, 'w', newline='', encoding='utf-8') as file:
+            if export_format(self.path) == 'csv':
+                writer = csv.writer(file)
+                writer.writerow(FIELDS)
+                write = writer.writerows
+            else:
+                write = lambda rows: file.writelines(json.dumps(dict(zip(FIELDS, row))) + '\n' for row in rows)
+
+            for rows in read_chunks(repository):
+                write(rows)
+                written += len(rows)
+                self.progress.emit(written, total)
+                if self.cancelled:
+                    break
+        return written
+
+    def write_snapshot(self, database, total): # VACUUM INTO copies the database page by page into a fresh, defragmented file
+        # it goes into an empty temp file next to the target and is only moved over it once it's done, so a failed VACUUM leaves the old file alone
+        handle, temp = tempfile.mkstemp(suffix='.db', dir=os.path.dirname(os.path.abspath(self.path)))
+        os.close(handle) # VACUUM INTO won't write over a file unless it's empty
+        try:
+            query = QSqlQuery(database)
+            query.prepare("VACUUM INTO ?")
+            query.addBindValue(temp)
+            if not query.exec():
+                raise OSError(query.lastError().text())
+            os.replace(temp, self.path)
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+        self.progress.emit(total, total)
+        return total
+
+    def remove_partial(self): # a snapshot never leaves half a file at path, so there's nothing of it to remove
+        if export_format(self.path) != 'sqlite' and os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,107 @@
+# makes synthetic lifeform logs for load testing and benchmarks, the same seed always gives the same rows
+# run with: python src/generator.py --rows 100000 [--mode realistic|uniform] [--seed 0] [--cover] [--database wonder_lifeforms.db]
+import argparse
+import itertools
+import random
+import sys
+import time
+from PySide6.QtCore import QCoreApplication
+from repository import LifeformRecord, LifeformRepository, CHUNK_SIZE
+from migrations import migrate
+from pragmas import Connection, OpenError, DEFAULT_PROFILE
+from lookups import RATINGS
+from combos import RADIX, BUILDS
+from main import DATABASE_FILE
+
+CONNECTION_NAME = "generator"
+
+SLOTS = [list(range(radix)) for radix in RADIX] # the codes of every slot but the rating and notes
+
+NOTE_WORDS = ["boss", "rush", "laser", "homing", "missile", "stage", "clear", "fast", "slow", "great", "combo", "shield",
+              "died", "early", "late", "no", "miss", "score", "bomb", "spread", "tight", "dodge", "crowd", "second", "loop"]
+
+def all_builds(): # every (life_form, main_shot, option_shot, clone_eyes, sp_weapon), in code order
+    return itertools.product(*SLOTS)
+
+def random_notes(rng, empty=0.0):
+    if rng.random() < empty:
+        return ''
+    notes = " ".join(rng.choices(NOTE_WORDS, k=rng.randint(2, 5)))
+    if rng.random() < 0.3:
+        notes += f" stage {rng.randint(1, 6)}"
+    return notes
+
+def uniform_records(rng): # every slot, rating and note word equally likely, forever
+    ratings = list(RATINGS)
+    while True:
+        build = [rng.choice(codes) for codes in SLOTS]
+        yield LifeformRecord(*build, rng.choice(ratings), random_notes(rng))
+
+def realistic_records(rng): # what a real log looks like, forever
+    # some life forms and weapons are favourites, good builds get played again and again,
+    # and the rating mostly follows how strong each part of the build is (plus a bad run now and then)
+    weights = []
+    strength = []
+    for codes in SLOTS:
+        strength.append({code: rng.gauss(0, 0.35) for code in codes})
+        order = sorted(codes, key=lambda code: -(strength[-1][code] + rng.gauss(0, 0.3))) # the stronger parts tend to be the favourites
+        weights.append({code: 1 / (rank + 1) for rank, code in enumerate(order)}) # zipf like, the favourite is picked most
+    played = [] # every build tried so far, once each so no build is replayed more often for having come up twice
+    tried = set()
+    while True:
+        if played and rng.random() < 0.35:
+            build = rng.choice(played) # back to a build that's been tried before
+        else:
+            build = tuple(rng.choices(codes, [weights[slot][code] for code in codes])[0] for slot, codes in enumerate(SLOTS))
+            if build not in tried:
+                tried.add(build)
+                played.append(build)
+        score = 1.8 + sum(strength[slot][code] for slot, code in enumerate(build)) + rng.gauss(0, 0.5)
+        rating = min(3, max(1, round(score)))
+        yield LifeformRecord(*build, rating, random_notes(rng, empty=0.4))
+
+def covering_records(rng, records): # every build once in a random order, then whatever records goes on to give
+    builds = list(all_builds())
+    rng.shuffle(builds)
+    ratings = list(RATINGS)
+    for build in builds:
+        yield LifeformRecord(*build, rng.choice(ratings), random_notes(rng, empty=0.4))
+    yield from records
+
+def records(rows, mode='realistic', seed=0, cover=False): # the first rows records of a dataset
+    rng = random.Random(seed)
+    source = realistic_records(rng) if mode == 'realistic' else uniform_records(rng)
+    if cover:
+        source = covering_records(rng, source)
+    return itertools.islice(source, rows)
+
+def generate(database, rows, mode='realistic', seed=0, cover=False, chunk_size=CHUNK_SIZE, progress=None): # inserts a dataset with batched inserts, returns the rows added
+    repository = LifeformRepository(database)
+    try:
+        return repository.add_many(records(rows, mode, seed, cover), chunk_size=chunk_size, progress=progress)
+    finally:
+        repository.close()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=BUILDS)
+    parser.add_argument("--mode", choices=['realistic', 'uniform'], default='realistic')
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cover", action='store_true', help=f"start with each of the {BUILDS:,} builds once")
+    parser.add_argument("--database", default=DATABASE_FILE)
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    try:
+        with Connection(args.database, CONNECTION_NAME, DEFAULT_PROFILE) as connection:
+            migrate(connection.database)
+            start = time.perf_counter()
+            added = generate(connection.database, args.rows, args.mode, args.seed, args.cover,
+                             progress=lambda total: print(f"\r{total:,} / {args.rows:,}", end='', flush=True))
+            seconds = time.perf_counter() - start
+    except OpenError as error:
+        sys.exit(f"Could not open {args.database}: {error}")
+    print(f"\rAdded {added:,} {args.mode} life forms to {args.database} in {seconds:.1f} s ({added / seconds:,.0f} rows/s)")
+
+if __name__ == "__main__":
+    main()
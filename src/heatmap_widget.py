@@ -0,0 +1,65 @@
+import math
+from PySide6.QtCore import QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QPainter
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+CELL = 34 # smallest cell size in pixels
+LABEL_WIDTH = 110
+LABEL_HEIGHT = 18
+EMPTY = QColor(128, 128, 128, 60) # cells with no runs logged
+
+def rating_color(mean): # 1 (bad) is red, 2 (good) is yellow, 3 (great) is green
+    step = min(max(mean - 1, 0), 2) / 2
+    if step < 0.5:
+        return QColor(215, int(80 + 300 * step), 70)
+    return QColor(int(215 - 330 * (step - 0.5)), 230, 70)
+
+class HeatmapWidget(QWidget): # paints a grid of mean ratings, the numbers come in already worked out (see ratings.py)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.means = []
+        self.counts = []
+        self.row_labels = []
+        self.column_labels = []
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def set_data(self, means, counts, row_labels, column_labels): # means and counts are 2d, rows x columns, means are nan where nothing was logged
+        self.means = means
+        self.counts = counts
+        self.row_labels = row_labels
+        self.column_labels = column_labels
+        self.updateGeometry()
+        self.update()
+
+    def sizeHint(self):
+        return QSize(LABEL_WIDTH + CELL * max(len(self.column_labels), 1), LABEL_HEIGHT + CELL * max(len(self.row_labels), 1))
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def paintEvent(self, event):
+        if not self.row_labels or not self.column_labels:
+            return
+        painter = QPainter(self)
+        rows, columns = len(self.row_labels), len(self.column_labels)
+        width = (self.width() - LABEL_WIDTH) / columns
+        height = (self.height() - LABEL_HEIGHT) / rows
+        text = self.palette().windowText().color()
+
+        painter.setPen(text)
+        for column, label in enumerate(self.column_labels):
+            painter.drawText(QRectF(LABEL_WIDTH + column * width, 0, width, LABEL_HEIGHT), Qt.AlignmentFlag.AlignCenter, label)
+        for row, label in enumerate(self.row_labels):
+            painter.drawText(QRectF(0, LABEL_HEIGHT + row * height, LABEL_WIDTH - 4, height), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label)
+
+        for row in range(rows):
+            for column in range(columns):
+                cell = QRectF(LABEL_WIDTH + column * width, LABEL_HEIGHT + row * height, width, height).adjusted(1, 1, -1, -1)
+                mean = float(self.means[row][column])
+                if math.isnan(mean):
+                    painter.fillRect(cell, EMPTY)
+                    continue
+                painter.fillRect(cell, rating_color(mean))
+                painter.setPen(Qt.GlobalColor.black)
+                painter.drawText(cell, Qt.AlignmentFlag.AlignCenter, f"{mean:.2f}\n{int(self.counts[row][column])}")
+        painter.end()
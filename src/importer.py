@@ -0,0 +1,102 @@
+import csv
+import json
+import os
+from PySide6.QtCore import QObject, Signal, Slot
+from repository import LifeformRecord, LifeformRepository, RepositoryError
+from pragmas import Connection, OpenError, DEFAULT_PROFILE
+from lookups import CODES, LABELS
+
+CONNECTION_NAME = "import"
+IMPORT_CHUNK_SIZE = 2000 # rows per transaction, also how often the progress bar moves
+MAX_ERRORS = 20 # only the first few bad rows are kept for the summary so a broken file can't fill up memory
+
+FIELDS = LifeformRecord._fields # the columns a file has to have (notes is optional)
+
+# files are read one line at a time and turned into records by generators, so nothing ever holds the whole file
+
+def read_lines(path, position): # yields the decoded lines of a file, position[0] keeps track of the bytes read so far
+    with open(path, 'rb') as file:
+        for line in file:
+            position[0] += len(line)
+            yield line.decode('utf-8-sig')
+
+def read_rows(path, position): # a dict per line for CSV (with a header row) or JSON Lines files
+    lines = read_lines(path, position)
+    if path.lower().endswith('.csv'):
+        yield from csv.DictReader(lines)
+    else:
+        for line in lines:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as error:
+                    yield error # handed on so parse_records can skip just this line
+
+def parse_value(column, value): # takes the label as shown in the table (e.g. "B: Hyper-Ray") or the code itself
+    if isinstance(value, str):
+        value = value.strip()
+        if value in CODES[column]:
+            return CODES[column][value]
+        if value.isdigit():
+            value = int(value)
+    if isinstance(value, int) and not isinstance(value, bool) and value in LABELS[column]:
+        return value
+    raise ValueError(f"unknown {FIELDS[column]} {value!r}")
+
+def parse_records(rows, errors): # validates each row and yields LifeformRecords, bad rows are skipped and noted in errors
+    for line, row in enumerate(rows, start=1):
+        try:
+            if isinstance(row, ValueError):
+                raise row
+            if not isinstance(row, dict):
+                raise ValueError("expected an object with the lifeform columns")
+            values = [parse_value(column, row.get(field)) for column, field in enumerate(FIELDS[:-1])]
+            notes = row.get('notes') or ''
+            yield LifeformRecord(*values, str(notes))
+        except ValueError as error:
+            errors['skipped'] += 1
+            if len(errors['messages']) < MAX_ERRORS:
+                errors['messages'].append(f"row {line}: {error}")
+
+class ImportWorker(QObject): # streams a CSV or JSON Lines file into the database on its own thread
+    progress = Signal(int, int) # percent of the file read, rows inserted
+    finished = Signal(int, int, str) # rows inserted, rows skipped, the first few problems
+    failed = Signal(str)
+
+    def __init__(self, database_file, path, profile=DEFAULT_PROFILE):
+        super().__init__()
+        self.database_file = database_file
+        self.path = path
+        self.profile = profile
+        self.cancelled = False # set from the GUI thread by cancel(), checked between chunks
+
+    def cancel(self):
+        self.cancelled = True
+
+    @Slot()
+    def run(self):
+        try:
+            with Connection(self.database_file, CONNECTION_NAME, self.profile) as connection:
+                self.import_rows(connection.database)
+        except OpenError as error:
+            self.failed.emit(f"Could not open your database\n{error}")
+
+    def import_rows(self, database):
+        size = max(os.path.getsize(self.path), 1)
+        position = [0]
+        errors = {'skipped': 0, 'messages': []}
+
+        def report(inserted):
+            self.progress.emit(int(position[0] * 100 / size), inserted)
+            return not self.cancelled
+
+        repository = LifeformRepository(database)
+        try:
+            records = parse_records(read_rows(self.path, position), errors)
+            inserted = repository.add_many(records, chunk_size=IMPORT_CHUNK_SIZE, progress=report)
+        except (OSError, UnicodeDecodeError, csv.Error, RepositoryError) as error:
+            self.failed.emit(str(error))
+            return
+        finally:
+            repository.close()
+        self.finished.emit(inserted, errors['skipped'], "\n".join(errors['messages']))
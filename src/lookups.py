@@ -0,0 +1,24 @@
+# the lifeforms table stores small integer codes, these are the labels they stand for
+# the codes line up with the combo box / tab indexes in main_ui, so a widget's currentIndex() is its code
+
+LIFE_FORMS = {0: 'Cyclopyge Unbonata', 1: 'Marrella Splendens', 2: 'Hallucigenia Sparsa', 3: 'Sarotrocercus Oblita', 4: 'Burgessia Bella', 5: 'Redlichia Rex'}
+SHOTS = {0: 'Blue: Vulcan', 1: 'Green: Wide', 2: 'Red: Power', 3: 'Purple: Multiway'} # main shot and option shot share the same list
+CLONE_EYES = {0: 'A: Normal', 1: 'B: Energy', 2: 'C: Blade', 3: 'D: Missile', 4: 'E: Power', 5: 'F: Force'}
+SP_WEAPONS = {0: 'A: Clustar', 1: 'B: Hyper-Ray', 2: 'C: Search', 3: 'D: Burst', 4: 'E: Verteblade', 5: 'F: Thunder'}
+RATINGS = {1: '1: Bad', 2: '2: Good', 3: '3: Great'} # the rating code is the rating itself
+
+# lookup table name and labels for each coded column of lifeforms, in table column order
+LOOKUPS = {
+    'life_form': ('life_forms', LIFE_FORMS),
+    'main_shot': ('shots', SHOTS),
+    'option_shot': ('shots', SHOTS),
+    'clone_eyes': ('clone_eyes', CLONE_EYES),
+    'sp_weapon': ('sp_weapons', SP_WEAPONS),
+    'rating': ('ratings', RATINGS),
+}
+
+LABELS = [labels for _, labels in LOOKUPS.values()] # LABELS[column][code], with column 0 being life_form
+CODES = [{label: code for code, label in labels.items()} for labels in LABELS] # CODES[column][label]
+
+def label(column, code): # the display text for a code, blank if the code is unknown (e.g. a label the migration couldn't match)
+    return LABELS[column].get(code, '')
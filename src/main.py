@@ -1,16 +1,76 @@
 import sys
-from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QMessageBox, QTableWidgetItem
-from PySide6.QtCore import QSettings
-from PySide6.QtSql import QSqlDatabase, QSqlQuery
+from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QMessageBox, QHeaderView, QFileDialog, QProgressDialog, QTableWidgetItem
+from PySide6.QtCore import QSettings, QThread, QMetaObject, Qt, Signal
+from PySide6.QtGui import QActionGroup
+from PySide6.QtSql import QSqlDatabase
+import numpy as np
 from main_ui import Ui_MainWindow as main_ui
 from about_ui import Ui_Form as about_ui
+from table_model import LifeformTableModel, SAMPLE_ROWS
+from pivot_model import PivotTableModel
+from queries import search_filter
+from migrations import migrate, unmatched_rows, MigrationError
+from worker import DatabaseWorker
+from importer import ImportWorker
+from exporter import ExportWorker
+from repository import LifeformRecord, RunRecord
+from combos import CoverageIndex, BUILDS_PER_LIFE_FORM, NEIGHBORS, pack_build, unpack_build, neighbors
+from ratings import RatingStats
+from predictor import BuildPredictor
+from ranking import BuildRanking, PAIR_POOL
+from lookups import LIFE_FORMS, SHOTS, CLONE_EYES, SP_WEAPONS
+from pragmas import apply_profile, profile_name, PROFILE_NAMES, DEFAULT_PROFILE
+
 import qdarkstyle
 
+DATABASE_FILE = "wonder_lifeforms.db"
+
+def build_label(build): # the display text for a packed build
+    life_form, main_shot, option_shot, clone_eyes, sp_weapon = unpack_build(build)
+    return f"{LIFE_FORMS[life_form]}: {SHOTS[main_shot]} / {SHOTS[option_shot]} / {CLONE_EYES[clone_eyes]} / {SP_WEAPONS[sp_weapon]}"
+
+def run_text(run): # score, stage and time of a RunRecord, then when it was played
+    text = f"{run.score:,}"
+    if run.stage is not None:
+        text += f"  stage {run.stage}"
+    if run.seconds is not None:
+        text += f"  {run.seconds // 3600}:{run.seconds % 3600 // 60:02}:{run.seconds % 60:02}"
+    return f"{text}  ({run.played_at})"
+
 class MainWindow(QMainWindow, main_ui): # used to display the main user interface
+    # requests for the database worker, they're queued over to its thread
+    add_requested = Signal(object)
+    update_requested = Signal(int, object)
+    remove_requested = Signal(int)
+    remove_all_requested = Signal()
+    profile_requested = Signal(str)
+    stats_requested = Signal()
+    compare_requested = Signal(int, int) # winner, loser
+    rankings_requested = Signal()
+    refit_requested = Signal()
+    log_run_requested = Signal(object) # RunRecord
+    runs_requested = Signal(int) # packed build
+
     def __init__(self):
         super().__init__()
         self.create_db()
         self.setupUi(self)
+        self.model = LifeformTableModel(self)
+        self.table.setModel(self.model)
+        self.setup_database_menu()
+        self.coverage = CoverageIndex() # which builds have been tried, see combos.py
+        self.ratings = RatingStats() # rating totals per build for the heatmaps, see ratings.py
+        self.predictor = BuildPredictor() # additive rating model for the suggestions, see predictor.py
+        self.ranking = BuildRanking() # head to head Elo scores, see ranking.py
+        self.setup_coverage_panel()
+        self.setup_head_to_head()
+        self.setup_run_log()
+        self.start_worker()
+        self.import_thread = None # made by File -> Import, see import_lifeforms
+        self.export_thread = None # and File -> Export
+        self.table.horizontalHeader().setResizeContentsPrecision(SAMPLE_ROWS) # size columns from a sample of rows instead of all of them
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed) # rows keep the default height so they never get measured
+        self.search = (None, None) # the (life_form, rating) filter the table is currently showing, None means All/Any
         self.settings_manager = SettingsManager(self)  # Initialize the SettingsManager
         self.settings_manager.load_settings()  # Load settings when the app starts
 
@@ -20,114 +80,103 @@ class MainWindow(QMainWindow, main_ui): # used to display the main user interfac
         self.button_remove.clicked.connect(self.remove_lifeform)
         self.button_remove_all.clicked.connect(self.remove_all)
         self.button_search.clicked.connect(self.search_lifeform)
+        self.line_search_notes.returnPressed.connect(self.search_lifeform)
+        self.table.selectionModel().currentRowChanged.connect(self.show_row) # picking a row loads it into the form for Update
         
         # Menu Bar
+        self.action_import.triggered.connect(self.import_lifeforms)
+        self.action_export.triggered.connect(self.export_lifeforms)
         self.action_about.triggered.connect(self.show_about)
         self.action_about_qt.triggered.connect(self.show_about_qt)
         self.action_dark_mode.toggled.connect(self.dark_mode)
+        self.action_database_info.triggered.connect(self.show_database_info)
 
         self.query_db()
+        self.stats_requested.emit() # fills the coverage index and rating totals, they're kept up to date from the worker replies after that
+        self.rankings_requested.emit()
+
+        if self.migrations: # let the user know if their database was just upgraded
+            version, _, _ = self.migrations[-1]
+            seconds = sum(seconds for _, _, seconds in self.migrations)
+            self.statusbar.showMessage(f"Database upgraded to version {version} in {seconds * 1000:.0f} ms", 10000)
 
     def add_lifeform(self):
+        self.add_requested.emit(self.form_record()) # the worker inserts it and answers with lifeform_added
+
+        self.line_notes.clear()  # Clear the notes input field after adding the lifeform
+
+    def form_record(self): # the LifeformRecord the form is set to, for Add and Update
+        # everything is stored as lookup codes (see lookups.py), which are just the tab and combo box indexes
         wonderful_group_index = self.tabWidget.currentIndex() # get the index number for each tab
-        life_form = self.tabWidget.tabText(wonderful_group_index) # get tab names (e.g. each Wonderful Life Form)
+        life_form = wonderful_group_index # the tab index is the Wonderful Life Form code
         
         clone_eyes_index = f"box_eyes_{wonderful_group_index}" # add the wonderful_group_index suffix to the combobox name (e.g. cb_eyes_0)
         clone_eyes_get = getattr(self, clone_eyes_index) # clone_eyes_get = cb_eyes_0 - 5 (depending on which tab you're on)
-        clone_eyes = clone_eyes_get.currentText() # grab the text in the clone eyes combo box
+        clone_eyes = clone_eyes_get.currentIndex() # grab the code of the clone eyes combo box
 
         sp_weapon_index = f"box_sp_weapon_{wonderful_group_index}" # add the wonderful_group_index suffix to the sp_weapon name (e.g. cb_sp_weapon_0)
         sp_weapon_get = getattr(self, sp_weapon_index) # sp_weapon_get = cb_sp_weapon_0 - 5 (depending on which tab you're on)
-        sp_weapon = sp_weapon_get.currentText() # grab the text in the special weapon combo box
+        sp_weapon = sp_weapon_get.currentIndex() # grab the code of the special weapon combo box
         
-        main_shot = self.box_main_shot.currentText()
-        option_shot = self.box_option_shot.currentText()
-        rating = self.box_rating.currentText()
+        main_shot = self.box_main_shot.currentIndex()
+        option_shot = self.box_option_shot.currentIndex()
+        rating = self.box_rating.currentIndex() + 1 # ratings are stored as 1 - 3
 
         notes = self.line_notes.text()
-       
-        query = QSqlQuery()
-        query.prepare("""
-                    INSERT INTO lifeforms (life_form, main_shot, option_shot, clone_eyes, sp_weapon, rating, notes)
-                    VALUES(?, ?, ?, ?, ?, ?, ?)
-                    """)
-        query.addBindValue(life_form)
-        query.addBindValue(main_shot)
-        query.addBindValue(option_shot)
-        query.addBindValue(clone_eyes)
-        query.addBindValue(sp_weapon)
-        query.addBindValue(rating)
-        query.addBindValue(notes)
-
-        query.exec()
-
-        self.query_db() # this will load the database back into the table with the updated information
 
-        self.line_notes.clear()  # Clear the notes input field after adding the lifeform
-       
-    def update_lifeform(self):
-        notes = self.line_notes.text()
-        selected_row = self.table.currentRow()
+        return LifeformRecord(life_form, main_shot, option_shot, clone_eyes, sp_weapon, rating, notes)
+
+    def update_lifeform(self): # saves the form to the chosen row, show_row loaded the row into it when it was picked
+        selected_row = self.table.currentIndex().row()
  
         if selected_row == -1:
             QMessageBox.warning(self, "no life form chosen", "please choose a wonderful life form to update")
             return
 
-        id = int(self.table.item(selected_row, 0).text())
-        life_form = self.table.item(selected_row, 1).text()
-        main_shot = self.table.item(selected_row, 2).text()
-        option_shot = self.table.item(selected_row, 3).text()
-        clone_eyes = self.table.item(selected_row, 4).text()
-        sp_weapon = self.table.item(selected_row, 5).text()
-        rating = self.table.item(selected_row, 6).text()
-        notes = self.table.item(selected_row, 7).text()
+        id = self.model.row_id(selected_row)
 
         confirm = QMessageBox.question(self, "Are you sure?", "Update life form Information?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if confirm == QMessageBox.StandardButton.No:
             return
 
-        query = QSqlQuery()
-        
-        query.prepare("""
-                      UPDATE lifeforms SET life_form = ?, main_shot = ?, option_shot = ?, clone_eyes = ?, sp_weapon = ?, rating = ?, notes = ? WHERE id = ?
-                      """)
-        
-        query.addBindValue(life_form)
-        query.addBindValue(main_shot)
-        query.addBindValue(option_shot)
-        query.addBindValue(clone_eyes)
-        query.addBindValue(sp_weapon)
-        query.addBindValue(rating)
-        query.addBindValue(notes)
-        query.addBindValue(id)
-
-        query.exec()
-
-        self.query_db()
+        self.update_requested.emit(id, self.form_record())
 
-        self.line_notes.clear()  # Clear the notes input field
+    def show_row(self, current): # fills the form from the table's current row, so Update only changes what gets edited
+        if not current.isValid():
+            return
+        life_form, main_shot, option_shot, clone_eyes, sp_weapon, rating, notes = self.model.row_values(current.row())
+        self.set_form(life_form, main_shot, option_shot, clone_eyes, sp_weapon)
+        if rating is not None:
+            self.box_rating.setCurrentIndex(rating - 1) # ratings are stored as 1 - 3
+        self.line_notes.setText(notes)
+
+    def set_form(self, life_form, main_shot, option_shot, clone_eyes, sp_weapon): # puts a build's codes into the form, a missing code (None) leaves its box as it is
+        if life_form is not None:
+            self.tabWidget.setCurrentIndex(life_form)
+            if clone_eyes is not None:
+                getattr(self, f"box_eyes_{life_form}").setCurrentIndex(clone_eyes)
+            if sp_weapon is not None:
+                getattr(self, f"box_sp_weapon_{life_form}").setCurrentIndex(sp_weapon)
+        if main_shot is not None:
+            self.box_main_shot.setCurrentIndex(main_shot)
+        if option_shot is not None:
+            self.box_option_shot.setCurrentIndex(option_shot)
 
     def remove_lifeform(self):
         self.line_notes.clear()  # Clear the notes input field
         
-        selected_row = self.table.currentRow()
+        selected_row = self.table.currentIndex().row()
         if selected_row == -1:
             QMessageBox.warning(self, "No Wonderful Life Form chosen", "Please choose a Wonderful Life Form to remove")
             return
 
-        id = int(self.table.item(selected_row, 0).text())
+        id = self.model.row_id(selected_row)
 
         confirm = QMessageBox.question(self, "Are you sure?", "Remove Wonderful Life Form?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if confirm == QMessageBox.StandardButton.No:
             return
 
-        query = QSqlQuery()
-        query.prepare("DELETE FROM lifeforms WHERE id = ?")
-        query.addBindValue(id)
-
-        query.exec()
-
-        self.query_db()
+        self.remove_requested.emit(id)
 
     def remove_all(self):
         self.line_notes.clear()  # Clear the notes input field
@@ -142,100 +191,513 @@ class MainWindow(QMainWindow, main_ui): # used to display the main user interfac
                     case QMessageBox.StandardButton.No:
                         return
 
-        query = QSqlQuery()
-        query.prepare("DELETE FROM lifeforms")
+        self.remove_all_requested.emit()
+
+    # the worker answers every change with one of these, and only the row it touched gets changed in the table
+    def lifeform_added(self, id, record):
+        if self.in_view(record.life_form, record.rating):
+            self.model.append_row(id, record)
+        self.coverage.add(record)
+        self.ratings.add(record)
+        self.predictor.add(record)
+        self.refresh_coverage()
+
+    def lifeform_updated(self, id, record):
+        row = self.model.row_of(id)
+        if row != -1:
+            old = LifeformRecord(*self.model.row_values(row)) # the old build, before the row gets the new values
+            self.coverage.remove(old)
+            self.coverage.add(record)
+            self.ratings.remove(old)
+            self.ratings.add(record)
+            self.predictor.remove(old)
+            self.predictor.add(record)
+            if self.in_view(record.life_form, record.rating):
+                self.model.update_row(row, record)
+            else:
+                self.model.remove_row(row) # edited out of the current search
+            self.refresh_coverage()
+        else:
+            self.stats_requested.emit() # don't know what the row was, so count again
+
+    def lifeform_removed(self, id):
+        row = self.model.row_of(id)
+        if row != -1:
+            old = LifeformRecord(*self.model.row_values(row))
+            self.coverage.remove(old)
+            self.ratings.remove(old)
+            self.predictor.remove(old)
+            self.model.remove_row(row)
+            self.refresh_coverage()
+        else:
+            self.stats_requested.emit()
 
-        query.exec()
+    def lifeforms_cleared(self):
+        self.model.clear()
+        self.coverage.clear()
+        self.ratings.clear()
+        self.predictor.clear()
+        self.refresh_coverage()
 
-        self.query_db()
+    def database_error(self, message):
+        self.button_refit.setEnabled(True) # a failed refit never sends refitted, a second refit queued behind some other error is harmless
+        QMessageBox.critical(self, "Database Error", message)
 
     def search_lifeform (self):
-        self.table.setRowCount(0)
-        
-        search_life_forms = self.box_search_life_forms.currentText()
-        if search_life_forms == 'All':
-            search_life_forms = '%'
-        else:
-            search_life_forms = self.box_search_life_forms.currentText()
-
-        search_rating = self.box_search_rating.currentText()
-        if search_rating == 'Any':
-            search_rating = '%'
-        else:
-            search_rating = self.box_search_rating.currentText()
+        search_life_forms = self.box_search_life_forms.currentIndex() - 1 # item 0 is All, the rest line up with the life form codes
+        if search_life_forms == -1:
+            search_life_forms = None # leave it out of the query so the indexes can be used
 
-        query = QSqlQuery("""
-                          SELECT * FROM lifeforms where 
-                          (life_form like ?) and
-                          (rating like ?) 
-                          """)
-        
-        query.addBindValue(search_life_forms)
-        query.addBindValue(search_rating)
+        search_rating = self.box_search_rating.currentIndex() # item 0 is Any, the rest are the ratings 1 - 3
+        if search_rating == 0:
+            search_rating = None
 
-        query.exec()
-        
-        row = 0
-        while query.next(): # while loop to query all the rows in the database and add them to the table
-            self.populate_table(query, row)
-            row += 1
+        self.search = (search_life_forms, search_rating)
+        self.load_table(*search_filter(search_life_forms, search_rating), self.line_search_notes.text()) # notes matches come back best first
 
     def query_db(self): # queries the database and updates the table
-        self.table.setRowCount(0)
-
-        query = QSqlQuery("SELECT * FROM lifeforms")
-
-        row = 0
-        while query.next(): # while loop to query all the rows in the database and add them to the table
-            self.populate_table(query, row)
-            row += 1
-
-    def populate_table(self, query, row):
-        # these query the database to get each values
-        id = query.value(0)
-        life_form = query.value(1)
-        main_shot = query.value(2)
-        option_shot = query.value(3)
-        clone_eyes = query.value(4)
-        sp_weapon = query.value(5)
-        rating = query.value(6)
-        notes = query.value(7)
-
-        # the queried values are then populated to the table
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels(['ID','Life Form','Main Shot','Option Shot','Clone Eyes','Special Weapon','Rating','Notes'])
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem('  '+str(id)+'  '))
-        self.table.setItem(row, 1, QTableWidgetItem('  '+life_form+'  '))
-        self.table.setItem(row, 2, QTableWidgetItem('  '+main_shot+'  '))
-        self.table.setItem(row, 3, QTableWidgetItem('  '+option_shot+'  '))
-        self.table.setItem(row, 4, QTableWidgetItem('  '+clone_eyes+'  '))
-        self.table.setItem(row, 5, QTableWidgetItem('  '+sp_weapon+'  '))
-        self.table.setItem(row, 6, QTableWidgetItem('  '+rating+'  '))
-        self.table.setItem(row, 7, QTableWidgetItem('  '+notes+'  '))
-        self.table.resizeColumnsToContents()
-        self.table.resizeRowsToContents()
+        self.search = (None, None)
+        self.load_table()
+
+    def in_view(self, life_form, rating): # checks if a row belongs in the table with the current search filter
+        search_life_forms, search_rating = self.search
+        return search_life_forms in (None, life_form) and search_rating in (None, rating)
+
+    def load_table(self, where='', values=(), notes=''): # points the table model at a filter, the worker sends the first page back
+        self.model.set_filter(where, values, notes)
+
+    def start_worker(self): # all the SQL after startup runs on this thread, see worker.py
+        self.worker_thread = QThread(self)
+        self.worker = DatabaseWorker(DATABASE_FILE, self.profile)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.worker.open)
+
+        self.model.page_requested.connect(self.worker.fetch_page)
+        self.worker.page_ready.connect(self.model.add_page)
+        self.model.first_page_loaded.connect(self.table.resizeColumnsToContents) # size the columns once, from the first page
+
+        self.add_requested.connect(self.worker.add)
+        self.update_requested.connect(self.worker.update)
+        self.remove_requested.connect(self.worker.remove)
+        self.remove_all_requested.connect(self.worker.remove_all)
+        self.worker.added.connect(self.lifeform_added)
+        self.worker.updated.connect(self.lifeform_updated)
+        self.worker.removed.connect(self.lifeform_removed)
+        self.worker.cleared.connect(self.lifeforms_cleared)
+        self.stats_requested.connect(self.worker.load_stats)
+        self.worker.stats_ready.connect(self.stats_loaded)
+        self.worker.failed.connect(self.database_error)
+        self.profile_requested.connect(self.worker.set_profile)
+        self.worker.profile_applied.connect(self.profile_applied)
+        self.compare_requested.connect(self.worker.compare)
+        self.rankings_requested.connect(self.worker.load_rankings)
+        self.refit_requested.connect(self.worker.refit_rankings)
+        self.worker.compared.connect(self.build_compared)
+        self.worker.rankings_ready.connect(self.rankings_loaded)
+        self.worker.refitted.connect(self.rankings_refitted)
+        self.log_run_requested.connect(self.worker.log_run)
+        self.runs_requested.connect(self.worker.load_runs)
+        self.worker.run_logged.connect(self.run_logged)
+        self.worker.runs_ready.connect(self.runs_loaded)
+
+        self.worker_thread.start()
+
+    def stop_worker(self):
+        QMetaObject.invokeMethod(self.worker, "close", Qt.ConnectionType.BlockingQueuedConnection)
+        self.worker_thread.quit()
+        self.worker_thread.wait()
         
     def create_db(self): # creates a database if none is found
         self.database = QSqlDatabase.addDatabase("QSQLITE")
-        self.database.setDatabaseName("wonder_lifeforms.db")
+        self.database.setDatabaseName(DATABASE_FILE)
         if not self.database.open():
             QMessageBox.critical(None, "Error","Could not open your database")
             sys.exit(1)
 
-        query = QSqlQuery()
-        query.exec("""
-                    CREATE TABLE IF NOT EXISTS lifeforms (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        life_form TEXT,
-                        main_shot TEXT,
-                        option_shot TEXT,
-                        clone_eyes TEXT,
-                        sp_weapon TEXT,
-                        rating TEXT,
-                        notes TEXT
-                    )
-                    """)
+        # the PRAGMA profile from Settings -> Database, WAL gets switched on (or off) here and stays with the file
+        self.profile = profile_name(QSettings('settings.ini', QSettings.IniFormat).value('database_profile', DEFAULT_PROFILE))
+        self.pragmas = apply_profile(self.database, self.profile)
+
+        try:
+            self.migrations = migrate(self.database) # upgrades older databases in place, see migrations.py
+        except MigrationError as error:
+            QMessageBox.critical(None, "Error", f"Could not upgrade your database\n{error}")
+            sys.exit(1)
+        if any(version == 2 for version, _, _ in self.migrations) and unmatched_rows(self.database):
+            QMessageBox.warning(None, "Database Upgrade", f"{unmatched_rows(self.database):,} life forms had values that aren't in the game's lists, those values were left empty.\n"
+                                "The rows are kept as they were in the lifeforms_v1 table of your database.")
+
+        self.database.close() # from here on the database worker has its own connection
+
+    def import_lifeforms(self): # File -> Import, streams a CSV or JSON Lines log into the database on its own thread
+        path, _ = QFileDialog.getOpenFileName(self, "Import Life Forms", "", "Life form logs (*.csv *.jsonl *.json);;All files (*)")
+        if not path:
+            return
+
+        self.import_progress = QProgressDialog("Importing life forms...", "Cancel", 0, 100, self)
+        self.import_progress.setWindowTitle("Import")
+        self.import_progress.setMinimumDuration(0)
+        self.import_progress.setAutoClose(False)
+        self.import_progress.setAutoReset(False)
+
+        self.import_thread = QThread(self)
+        self.import_worker = ImportWorker(DATABASE_FILE, path, self.profile)
+        self.import_worker.moveToThread(self.import_thread)
+        self.import_thread.started.connect(self.import_worker.run)
+        self.import_worker.progress.connect(self.import_step)
+        self.import_worker.finished.connect(self.import_finished)
+        self.import_worker.failed.connect(self.import_failed)
+        self.import_progress.canceled.connect(self.import_worker.cancel, Qt.ConnectionType.DirectConnection) # just sets a flag, the worker checks it between chunks
+        self.action_import.setEnabled(False)
+        self.import_thread.start()
+
+    def import_step(self, percent, inserted):
+        self.import_progress.setValue(percent)
+        self.import_progress.setLabelText(f"Imported {inserted:,} life forms...")
+
+    def import_finished(self, inserted, skipped, problems):
+        self.end_import()
+        message = f"Imported {inserted:,} life forms."
+        if self.import_worker.cancelled:
+            message = f"Import cancelled, {inserted:,} life forms were imported before stopping."
+        if skipped:
+            message += f"\n\nSkipped {skipped:,} rows that didn't match the known values:\n{problems}"
+        QMessageBox.information(self, "Import", message)
+
+    def import_failed(self, message):
+        self.end_import()
+        QMessageBox.critical(self, "Import Error", message)
+
+    def end_import(self):
+        self.import_thread.quit()
+        self.import_thread.wait()
+        self.import_progress.canceled.disconnect() # closing the dialog would count as pressing Cancel otherwise
+        self.import_progress.close()
+        self.action_import.setEnabled(True)
+        self.query_db() # a whole file went in, so this is the one time the table gets reloaded
+        self.stats_requested.emit()
+
+    def stop_import(self): # closing the window mid import, Qt aborts if a thread still running gets destroyed
+        if self.import_thread is None or not self.import_thread.isRunning():
+            return
+        self.import_worker.finished.disconnect() # nothing to report on the way out
+        self.import_worker.failed.disconnect()
+        self.import_worker.cancel() # stops after the chunk it's on, the rows already in stay committed
+        self.import_thread.quit()
+        self.import_thread.wait()
+
+    def export_lifeforms(self): # File -> Export, reads the table in chunks on its own thread and writes it out
+        path, _ = QFileDialog.getSaveFileName(self, "Export Life Forms", "wonder_lifeforms.csv", "CSV (*.csv);;JSON Lines (*.jsonl);;SQLite snapshot (*.db)")
+        if not path:
+            return
+
+        self.export_progress = QProgressDialog("Exporting life forms...", "Cancel", 0, 100, self)
+        self.export_progress.setWindowTitle("Export")
+        self.export_progress.setMinimumDuration(0)
+        self.export_progress.setAutoClose(False)
+        self.export_progress.setAutoReset(False)
+
+        self.export_thread = QThread(self)
+        self.export_worker = ExportWorker(DATABASE_FILE, path, self.profile)
+        self.export_worker.moveToThread(self.export_thread)
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_worker.progress.connect(self.export_step)
+        self.export_worker.finished.connect(self.export_finished)
+        self.export_worker.failed.connect(self.export_failed)
+        self.export_progress.canceled.connect(self.export_worker.cancel, Qt.ConnectionType.DirectConnection)
+        self.action_export.setEnabled(False)
+        self.export_thread.start()
+
+    def export_step(self, written, total):
+        self.export_progress.setValue(int(written * 100 / max(total, 1)))
+        self.export_progress.setLabelText(f"Exported {written:,} of {total:,} life forms...")
+
+    def export_finished(self, written, seconds):
+        self.end_export()
+        if self.export_worker.cancelled:
+            self.statusbar.showMessage("Export cancelled", 10000)
+            return
+        self.statusbar.showMessage(f"Exported {written:,} life forms in {seconds:.1f} s ({written / max(seconds, 0.001):,.0f} rows/s)", 10000)
+
+    def export_failed(self, message):
+        self.end_export()
+        QMessageBox.critical(self, "Export Error", message)
+
+    def end_export(self):
+        self.export_thread.quit()
+        self.export_thread.wait()
+        self.export_progress.canceled.disconnect()
+        self.export_progress.close()
+        self.action_export.setEnabled(True)
+
+    def stop_export(self): # same as stop_import, the worker deletes the half written file when cancelled (a snapshot just runs to the end)
+        if self.export_thread is None or not self.export_thread.isRunning():
+            return
+        self.export_worker.finished.disconnect()
+        self.export_worker.failed.disconnect()
+        self.export_worker.cancel()
+        self.export_thread.quit()
+        self.export_thread.wait()
+
+    def setup_database_menu(self): # one checkable entry per PRAGMA profile in pragmas.py, above Active Profile...
+        self.profile_group = QActionGroup(self)
+        for profile, name in PROFILE_NAMES.items():
+            action = self.profile_group.addAction(name)
+            action.setCheckable(True)
+            action.setChecked(profile == self.profile)
+            action.triggered.connect(lambda checked, profile=profile: self.choose_profile(profile))
+            self.menuDatabase.insertAction(self.action_database_info, action)
+        self.menuDatabase.insertSeparator(self.action_database_info)
+
+    def choose_profile(self, profile): # the worker switches its connection over, import and export pick it up next time they run
+        self.profile = profile
+        self.profile_requested.emit(profile)
+
+    def profile_applied(self, profile, pragmas):
+        self.pragmas = pragmas
+        self.statusbar.showMessage(f"Database profile: {PROFILE_NAMES[profile]}", 5000)
+
+    def show_database_info(self): # Settings -> Database -> Active Profile, the values SQLite reported back, not just what was asked for
+        settings = "\n".join(f"{pragma} = {value}" for pragma, value in self.pragmas.items())
+        QMessageBox.information(self, "Database Profile", f"{PROFILE_NAMES[self.profile]}\n\n{settings}")
+
+    def setup_coverage_panel(self): # View -> Coverage, tested vs untested builds for each life form
+        self.table_coverage.setRowCount(len(LIFE_FORMS))
+        self.table_coverage.setVerticalHeaderLabels(list(LIFE_FORMS.values()))
+        self.table_coverage.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table_coverage.itemSelectionChanged.connect(self.show_untested)
+        self.menuView.addAction(self.dock_coverage.toggleViewAction())
+        self.tabWidget.currentChanged.connect(self.refresh_heatmap) # the heatmaps follow the life form tab
+        self.tab_insights.currentChanged.connect(self.refresh_heatmap)
+        self.tab_insights.currentChanged.connect(self.refresh_suggestions)
+        self.list_suggestions.itemDoubleClicked.connect(self.use_suggestion)
+        self.pivot_model = PivotTableModel(self)
+        self.table_pivot.setModel(self.pivot_model)
+        self.table_pivot.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table_pivot.horizontalHeader().setResizeContentsPrecision(SAMPLE_ROWS) # a full drill down is 3,456 rows, same sizing trick as the main table
+        self.table_pivot.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.pivot_checks = [self.check_pivot_life_form, self.check_pivot_main_shot, self.check_pivot_option_shot,
+                             self.check_pivot_clone_eyes, self.check_pivot_sp_weapon] # in cube axis order, see ratings.py
+        for check in self.pivot_checks:
+            check.toggled.connect(self.refresh_pivot) # ticking a slot drills down into it, unticking rolls it back up
+        self.tab_insights.currentChanged.connect(self.refresh_pivot)
+        self.table.selectionModel().currentRowChanged.connect(self.refresh_neighbors)
+        self.tab_insights.currentChanged.connect(self.refresh_neighbors)
+        self.list_neighbors.itemDoubleClicked.connect(self.use_suggestion) # the items carry a packed build just like the suggestions
+
+    def setup_head_to_head(self): # Builds -> Head to Head, pick the better of two builds to rank the ones the ratings can't separate
+        self.pair = None # (build a, build b) on the buttons, packed
+        self.rng = np.random.default_rng()
+        self.button_build_a.clicked.connect(lambda: self.choose_build(0))
+        self.button_build_b.clicked.connect(lambda: self.choose_build(1))
+        self.button_new_pair.clicked.connect(self.next_pair)
+        self.button_refit.clicked.connect(self.refit_rankings)
+        self.tab_insights.currentChanged.connect(self.refresh_head_to_head)
+
+    def setup_run_log(self): # Builds -> Runs, scores are logged against whatever build the form above is showing
+        self.button_log_run.clicked.connect(self.log_run)
+        self.spin_score.lineEdit().returnPressed.connect(self.log_run) # type a score and press Enter, nothing else needs touching
+        self.tab_insights.currentChanged.connect(self.refresh_runs)
+        self.tabWidget.currentChanged.connect(self.refresh_runs)
+        self.box_main_shot.currentIndexChanged.connect(self.refresh_runs)
+        self.box_option_shot.currentIndexChanged.connect(self.refresh_runs)
+        for life_form in LIFE_FORMS:
+            getattr(self, f"box_eyes_{life_form}").currentIndexChanged.connect(self.refresh_runs)
+            getattr(self, f"box_sp_weapon_{life_form}").currentIndexChanged.connect(self.refresh_runs)
+
+    def stats_loaded(self, counts, ratings):
+        self.coverage.load(counts)
+        self.ratings = ratings
+        self.predictor.fit(ratings.counts, ratings.sums)
+        self.refresh_coverage()
+
+    def refresh_coverage(self): # only reads the counts the index already keeps, so it's cheap enough to run after every change
+        for life_form in LIFE_FORMS:
+            tested = self.coverage.tested(life_form)
+            for column, text in enumerate((f"{tested}", f"{BUILDS_PER_LIFE_FORM - tested}", f"{tested * 100 / BUILDS_PER_LIFE_FORM:.1f}%")):
+                item = self.table_coverage.item(life_form, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                    self.table_coverage.setItem(life_form, column, item)
+                item.setText(text)
+        self.show_untested()
+        self.refresh_heatmap()
+        self.refresh_suggestions()
+        self.refresh_pivot()
+        self.refresh_neighbors()
+        self.refresh_head_to_head()
+
+    def show_untested(self): # lists the builds nobody has tried yet for the life form picked in the coverage table
+        self.list_untested.clear()
+        rows = self.table_coverage.selectionModel().selectedRows()
+        if not rows:
+            self.label_untested.setText("Untested builds (pick a life form)")
+            return
+        life_form = rows[0].row()
+        builds = [f"{SHOTS[main_shot]} / {SHOTS[option_shot]} / {CLONE_EYES[clone_eyes]} / {SP_WEAPONS[sp_weapon]}"
+                  for _, main_shot, option_shot, clone_eyes, sp_weapon in self.coverage.untested(life_form)]
+        self.label_untested.setText(f"Untested builds for {LIFE_FORMS[life_form]} ({len(builds)})")
+        self.list_untested.addItems(builds)
+
+    def refresh_heatmap(self): # two small sums over the rating totals, well under a millisecond however many runs there are
+        if not self.tab_heatmap.isVisible():
+            return # it gets drawn when it's shown
+        life_form = self.tabWidget.currentIndex()
+        (shot_means, shot_counts), (eye_means, eye_counts) = self.ratings.heatmaps(life_form)
+        shots = [name.split(': ')[1] for name in SHOTS.values()]
+        self.label_heatmap.setText(f"Mean rating for {LIFE_FORMS[life_form]}\nmain shot x option shot, clone eyes x special weapon")
+        self.heatmap_shots.set_data(shot_means, shot_counts, shots, shots)
+        self.heatmap_eyes_weapons.set_data(eye_means, eye_counts, list(CLONE_EYES.values()), [name.split(': ')[0] for name in SP_WEAPONS.values()])
+
+    def refresh_suggestions(self): # the untested builds the model thinks will rate best, refitting is a rank one update so this runs after every change
+        if not self.tab_suggestions.isVisible():
+            return
+        self.list_suggestions.clear()
+        tested = np.asarray(self.coverage.counts) > 0
+        suggestions = self.predictor.suggestions(tested)
+        if not suggestions:
+            self.label_suggestions.setText("Suggested next builds (rate a few builds first)")
+            return
+        self.label_suggestions.setText(f"Suggested next builds, from {self.predictor.runs:,} rated runs (double click to fill in the form)")
+        for build, predicted in suggestions:
+            self.list_suggestions.addItem(f"{predicted:.2f}  {build_label(build)}")
+            self.list_suggestions.item(self.list_suggestions.count() - 1).setData(Qt.ItemDataRole.UserRole, build)
+
+    def refresh_pivot(self): # a sum over the rating cube, cached by RatingStats until the totals change, so switching slots never touches SQL
+        if not self.tab_pivot.isVisible():
+            return
+        slots = [slot for slot, check in enumerate(self.pivot_checks) if check.isChecked()]
+        means, counts = self.ratings.pivot(slots)
+        names = [check.text() for check in self.pivot_checks if check.isChecked()]
+        self.label_pivot.setText(f"Mean rating by {' x '.join(names) if names else 'everything'}, "
+                                 f"{np.count_nonzero(counts):,} of {counts.size:,} cells rated ({int(counts.sum()):,} rated runs)")
+        self.pivot_model.set_pivot(slots, means, counts)
+
+    def refresh_neighbors(self): # the logged builds one slot swap away from the table's current row, read from the neighbor index in combos.py
+        if not self.tab_neighbors.isVisible():
+            return
+        self.list_neighbors.clear()
+        row = self.table.currentIndex().row()
+        build = pack_build(self.model.row_values(row)[:5]) if 0 <= row < self.model.rowCount() else None
+        if build is None:
+            self.label_neighbors.setText("Builds one swap away (pick a row in the table)")
+            return
+
+        slots = [None, ('Main Shot', SHOTS), ('Option Shot', SHOTS), ('Clone Eyes', CLONE_EYES), ('Special Weapon', SP_WEAPONS)]
+        logged = 0
+        for slot, neighbor in neighbors(build):
+            runs = self.coverage.counts[neighbor]
+            if runs == 0:
+                continue # only builds that have been played
+            logged += 1
+            name, labels = slots[slot]
+            rated = self.ratings.counts[neighbor]
+            mean = f"{self.ratings.sums[neighbor] / rated:.2f}" if rated else "unrated"
+            self.list_neighbors.addItem(f"{mean}  {name} → {labels[unpack_build(neighbor)[slot]]}  ({runs:,} run{'s' if runs != 1 else ''})")
+            self.list_neighbors.item(self.list_neighbors.count() - 1).setData(Qt.ItemDataRole.UserRole, neighbor)
+
+        rated = self.ratings.counts[build]
+        mean = f"{self.ratings.sums[build] / rated:.2f} from {rated:,} rated runs" if rated else "not rated yet"
+        self.label_neighbors.setText(f"{build_label(build)}, "
+                                     f"{mean}\n{logged} of {NEIGHBORS} builds one swap away have been logged (double click to fill in the form)")
+
+    def refresh_head_to_head(self): # puts a pair up if there isn't one yet and redraws the rankings, the pair only changes after a pick
+        if not self.tab_head_to_head.isVisible():
+            return
+        if self.pair is None:
+            self.next_pair()
+        self.list_rankings.clear()
+        top = self.ranking.top()
+        if not top:
+            self.label_rankings.setText("Rankings (none yet, pick the better build a few times)")
+            return
+        self.label_rankings.setText(f"Rankings by Elo, with the last Bradley-Terry fit in brackets ({self.ranking.comparisons.sum() // 2:,} head to heads)")
+        for place, (build, elo, strength) in enumerate(top, 1):
+            refit = "" if np.isnan(strength) else f" ({strength:.0f})"
+            self.list_rankings.addItem(f"{place}. {elo:.0f}{refit}  {build_label(build)}  ({self.ranking.comparisons[build]} head to heads)")
+
+    def next_pair(self): # two of the best rated builds, see BuildRanking.pair for which two
+        rated = np.flatnonzero(self.ratings.counts > 0)
+        means = self.ratings.sums[rated] / self.ratings.counts[rated]
+        pool = rated[np.argsort(-means, kind='stable')][:PAIR_POOL]
+        self.pair = self.ranking.pair(pool, self.rng)
+        if self.pair is None:
+            self.label_head_to_head.setText("Which build is better? (rate at least two builds first)")
+            self.button_build_a.setText("")
+            self.button_build_b.setText("")
+            self.button_build_a.setEnabled(False)
+            self.button_build_b.setEnabled(False)
+            return
+        self.label_head_to_head.setText(f"Which build is better? (out of the {len(pool)} best rated builds)")
+        for button, build in zip((self.button_build_a, self.button_build_b), self.pair):
+            button.setText(f"{build_label(build)}\n{self.ranking.elo[build]:.0f} Elo, {self.ranking.comparisons[build]} head to heads")
+            button.setEnabled(True)
+
+    def choose_build(self, side): # 0 for the top button, 1 for the bottom one, the worker saves it and answers with build_compared
+        if self.pair is None:
+            return
+        self.button_build_a.setEnabled(False) # until the worker answers, so one pair can't be counted twice
+        self.button_build_b.setEnabled(False)
+        self.compare_requested.emit(self.pair[side], self.pair[1 - side])
+
+    def build_compared(self, winner, loser, winner_elo, loser_elo):
+        self.ranking.set_elo(winner, winner_elo, self.ranking.comparisons[winner] + 1)
+        self.ranking.set_elo(loser, loser_elo, self.ranking.comparisons[loser] + 1)
+        self.next_pair()
+        self.refresh_head_to_head()
+
+    def refit_rankings(self): # Bradley-Terry over every comparison, on the worker thread
+        self.button_refit.setEnabled(False)
+        self.refit_requested.emit()
+
+    def rankings_refitted(self, comparisons, seconds):
+        self.button_refit.setEnabled(True)
+        self.statusbar.showMessage(f"Refitted the rankings from {comparisons:,} head to heads in {seconds * 1000:.0f} ms", 5000)
+
+    def rankings_loaded(self, ranking):
+        self.ranking = ranking
+        self.refresh_head_to_head()
+
+    def form_build(self): # the packed build the add form is set to
+        return pack_build(self.form_record()[:5])
+
+    def refresh_runs(self): # asks the worker for the runs of the form's build, the answer comes back in runs_loaded
+        if not self.tab_runs.isVisible():
+            return
+        build = self.form_build()
+        self.label_runs.setText(f"Runs for {build_label(build)}")
+        self.runs_requested.emit(build)
+
+    def log_run(self):
+        duration = self.time_duration.time().msecsSinceStartOfDay() // 1000
+        run = RunRecord(self.form_build(), self.spin_score.value(), self.spin_stage.value() or None, duration or None) # 0 means not given
+        self.log_run_requested.emit(run)
+        self.spin_score.selectAll() # ready for the next score
+
+    def run_logged(self, id, run):
+        self.statusbar.showMessage(f"Logged a run of {run.score:,} for {build_label(run.build)}", 5000)
+
+    def runs_loaded(self, build, top, recent):
+        if build != self.form_build():
+            return # the form has moved on to another build since
+        self.list_top_runs.clear()
+        self.list_top_runs.addItems([f"{place}. {run_text(run)}  {build_label(run.build)}" for place, (_, run) in enumerate(top, 1)])
+        self.list_recent_runs.clear()
+        self.list_recent_runs.addItems([run_text(run) for _, run in recent])
+
+        # the trend compares the newest half of the runs shown with the older half
+        scores = [run.score for _, run in recent]
+        half = len(scores) // 2
+        if half == 0:
+            self.label_recent_runs.setText(f"Latest runs ({len(scores)})")
+            return
+        newer = sum(scores[:half]) / half
+        older = sum(scores[half:half * 2]) / half
+        self.label_recent_runs.setText(f"Latest runs, the last {half} average {newer:,.0f} against {older:,.0f} for the {half} before ({newer - older:+,.0f})")
+
+    def use_suggestion(self, item): # puts a suggested build into the add form, ready to be rated
+        self.set_form(*unpack_build(item.data(Qt.ItemDataRole.UserRole)))
 
     def dark_mode(self, checked):
         if checked:
@@ -252,6 +714,9 @@ class MainWindow(QMainWindow, main_ui): # used to display the main user interfac
 
     def closeEvent(self, event): #settings will save when closing the app
         self.settings_manager.save_settings()  # Save settings using the manager
+        self.stop_import()
+        self.stop_export()
+        self.stop_worker()
         event.accept()
 
 class SettingsManager: # used to load and save settings when opening and closing the app
@@ -276,6 +741,7 @@ class SettingsManager: # used to load and save settings when opening and closing
         self.settings.setValue('window_size', self.main_window.size())
         self.settings.setValue('window_pos', self.main_window.pos())
         self.settings.setValue('dark_mode', self.main_window.action_dark_mode.isChecked())
+        self.settings.setValue('database_profile', self.main_window.profile)
 
 class AboutWindow(QWidget, about_ui): # Configures the About window
     def __init__(self, dark_mode=False):
@@ -16,11 +16,15 @@ from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
     QIcon, QImage, QKeySequence, QLinearGradient,
     QPainter, QPalette, QPixmap, QRadialGradient,
     QTransform)
-from PySide6.QtWidgets import (QApplication, QComboBox, QGridLayout, QGroupBox,
-    QHBoxLayout, QHeaderView, QLabel, QLineEdit,
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QComboBox,
+    QDockWidget, QGridLayout, QGroupBox, QHBoxLayout, QHeaderView,
+    QLabel, QLineEdit, QListWidget, QListWidgetItem,
     QMainWindow, QMenu, QMenuBar, QPushButton,
-    QSizePolicy, QSpacerItem, QStatusBar, QTabWidget,
-    QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget)
+    QSizePolicy, QSpacerItem, QSpinBox, QStatusBar,
+    QTabWidget, QTableView, QTableWidget, QTableWidgetItem,
+    QTimeEdit, QVBoxLayout, QWidget)
+
+from heatmap_widget import HeatmapWidget
 import resources_rc
 
 class Ui_MainWindow(object):
@@ -38,6 +42,12 @@ class Ui_MainWindow(object):
         self.action_about.setObjectName(u"action_about")
         self.action_about_qt = QAction(MainWindow)
         self.action_about_qt.setObjectName(u"action_about_qt")
+        self.action_import = QAction(MainWindow)
+        self.action_import.setObjectName(u"action_import")
+        self.action_export = QAction(MainWindow)
+        self.action_export.setObjectName(u"action_export")
+        self.action_database_info = QAction(MainWindow)
+        self.action_database_info.setObjectName(u"action_database_info")
         self.centralwidget = QWidget(MainWindow)
         self.centralwidget.setObjectName(u"centralwidget")
         self.verticalLayout_9 = QVBoxLayout(self.centralwidget)
@@ -512,7 +522,7 @@ class Ui_MainWindow(object):
 
         self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
-        self.grid_database.addItem(self.horizontalSpacer, 1, 2, 1, 1)
+        self.grid_database.addItem(self.horizontalSpacer, 1, 3, 1, 1)
 
         self.verticalSpacer = QSpacerItem(20, 10, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
 
@@ -530,10 +540,21 @@ class Ui_MainWindow(object):
 
         self.grid_database.addWidget(self.box_search_rating, 1, 1, 1, 1)
 
+        self.label_search_notes = QLabel(self.group_search)
+        self.label_search_notes.setObjectName(u"label_search_notes")
+
+        self.grid_database.addWidget(self.label_search_notes, 0, 2, 1, 1)
+
+        self.line_search_notes = QLineEdit(self.group_search)
+        self.line_search_notes.setObjectName(u"line_search_notes")
+        self.line_search_notes.setClearButtonEnabled(True)
+
+        self.grid_database.addWidget(self.line_search_notes, 1, 2, 1, 1)
+
 
         self.verticalLayout_3.addLayout(self.grid_database)
 
-        self.table = QTableWidget(self.group_search)
+        self.table = QTableView(self.group_search)
         self.table.setObjectName(u"table")
         sizePolicy4 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
         sizePolicy4.setHorizontalStretch(0)
@@ -541,6 +562,8 @@ class Ui_MainWindow(object):
         sizePolicy4.setHeightForWidth(self.table.sizePolicy().hasHeightForWidth())
         self.table.setSizePolicy(sizePolicy4)
         self.table.setMinimumSize(QSize(867, 50))
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.horizontalHeader().setCascadingSectionResizes(True)
         self.table.horizontalHeader().setMinimumSectionSize(20)
         self.table.horizontalHeader().setDefaultSectionSize(130)
@@ -554,11 +577,293 @@ class Ui_MainWindow(object):
         self.verticalLayout_9.addWidget(self.group_search)
 
         MainWindow.setCentralWidget(self.centralwidget)
+        self.dock_coverage = QDockWidget(MainWindow)
+        self.dock_coverage.setObjectName(u"dock_coverage")
+        self.dock_coverage_contents = QWidget()
+        self.dock_coverage_contents.setObjectName(u"dock_coverage_contents")
+        self.verticalLayout_dock = QVBoxLayout(self.dock_coverage_contents)
+        self.verticalLayout_dock.setObjectName(u"verticalLayout_dock")
+        self.tab_insights = QTabWidget(self.dock_coverage_contents)
+        self.tab_insights.setObjectName(u"tab_insights")
+        self.tab_coverage = QWidget()
+        self.tab_coverage.setObjectName(u"tab_coverage")
+        self.verticalLayout_coverage = QVBoxLayout(self.tab_coverage)
+        self.verticalLayout_coverage.setObjectName(u"verticalLayout_coverage")
+        self.table_coverage = QTableWidget(self.tab_coverage)
+        if (self.table_coverage.columnCount() < 3):
+            self.table_coverage.setColumnCount(3)
+        __qtablewidgetitem = QTableWidgetItem()
+        self.table_coverage.setHorizontalHeaderItem(0, __qtablewidgetitem)
+        __qtablewidgetitem1 = QTableWidgetItem()
+        self.table_coverage.setHorizontalHeaderItem(1, __qtablewidgetitem1)
+        __qtablewidgetitem2 = QTableWidgetItem()
+        self.table_coverage.setHorizontalHeaderItem(2, __qtablewidgetitem2)
+        self.table_coverage.setObjectName(u"table_coverage")
+        self.table_coverage.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_coverage.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table_coverage.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+
+        self.verticalLayout_coverage.addWidget(self.table_coverage)
+
+        self.label_untested = QLabel(self.tab_coverage)
+        self.label_untested.setObjectName(u"label_untested")
+
+        self.verticalLayout_coverage.addWidget(self.label_untested)
+
+        self.list_untested = QListWidget(self.tab_coverage)
+        self.list_untested.setObjectName(u"list_untested")
+        self.list_untested.setUniformItemSizes(True)
+
+        self.verticalLayout_coverage.addWidget(self.list_untested)
+
+        self.tab_insights.addTab(self.tab_coverage, "")
+        self.tab_heatmap = QWidget()
+        self.tab_heatmap.setObjectName(u"tab_heatmap")
+        self.verticalLayout_heatmap = QVBoxLayout(self.tab_heatmap)
+        self.verticalLayout_heatmap.setObjectName(u"verticalLayout_heatmap")
+        self.label_heatmap = QLabel(self.tab_heatmap)
+        self.label_heatmap.setObjectName(u"label_heatmap")
+        self.label_heatmap.setWordWrap(True)
+
+        self.verticalLayout_heatmap.addWidget(self.label_heatmap)
+
+        self.heatmap_shots = HeatmapWidget(self.tab_heatmap)
+        self.heatmap_shots.setObjectName(u"heatmap_shots")
+
+        self.verticalLayout_heatmap.addWidget(self.heatmap_shots)
+
+        self.heatmap_eyes_weapons = HeatmapWidget(self.tab_heatmap)
+        self.heatmap_eyes_weapons.setObjectName(u"heatmap_eyes_weapons")
+
+        self.verticalLayout_heatmap.addWidget(self.heatmap_eyes_weapons)
+
+        self.tab_insights.addTab(self.tab_heatmap, "")
+        self.tab_suggestions = QWidget()
+        self.tab_suggestions.setObjectName(u"tab_suggestions")
+        self.verticalLayout_suggestions = QVBoxLayout(self.tab_suggestions)
+        self.verticalLayout_suggestions.setObjectName(u"verticalLayout_suggestions")
+        self.label_suggestions = QLabel(self.tab_suggestions)
+        self.label_suggestions.setObjectName(u"label_suggestions")
+        self.label_suggestions.setWordWrap(True)
+
+        self.verticalLayout_suggestions.addWidget(self.label_suggestions)
+
+        self.list_suggestions = QListWidget(self.tab_suggestions)
+        self.list_suggestions.setObjectName(u"list_suggestions")
+        self.list_suggestions.setUniformItemSizes(True)
+
+        self.verticalLayout_suggestions.addWidget(self.list_suggestions)
+
+        self.tab_insights.addTab(self.tab_suggestions, "")
+        self.tab_pivot = QWidget()
+        self.tab_pivot.setObjectName(u"tab_pivot")
+        self.verticalLayout_pivot = QVBoxLayout(self.tab_pivot)
+        self.verticalLayout_pivot.setObjectName(u"verticalLayout_pivot")
+        self.label_pivot = QLabel(self.tab_pivot)
+        self.label_pivot.setObjectName(u"label_pivot")
+        self.label_pivot.setWordWrap(True)
+
+        self.verticalLayout_pivot.addWidget(self.label_pivot)
+
+        self.horizontalLayout_pivot = QHBoxLayout()
+        self.horizontalLayout_pivot.setObjectName(u"horizontalLayout_pivot")
+        self.check_pivot_life_form = QCheckBox(self.tab_pivot)
+        self.check_pivot_life_form.setObjectName(u"check_pivot_life_form")
+        self.check_pivot_life_form.setChecked(True)
+
+        self.horizontalLayout_pivot.addWidget(self.check_pivot_life_form)
+
+        self.check_pivot_main_shot = QCheckBox(self.tab_pivot)
+        self.check_pivot_main_shot.setObjectName(u"check_pivot_main_shot")
+
+        self.horizontalLayout_pivot.addWidget(self.check_pivot_main_shot)
+
+        self.check_pivot_option_shot = QCheckBox(self.tab_pivot)
+        self.check_pivot_option_shot.setObjectName(u"check_pivot_option_shot")
+
+        self.horizontalLayout_pivot.addWidget(self.check_pivot_option_shot)
+
+        self.check_pivot_clone_eyes = QCheckBox(self.tab_pivot)
+        self.check_pivot_clone_eyes.setObjectName(u"check_pivot_clone_eyes")
+
+        self.horizontalLayout_pivot.addWidget(self.check_pivot_clone_eyes)
+
+        self.check_pivot_sp_weapon = QCheckBox(self.tab_pivot)
+        self.check_pivot_sp_weapon.setObjectName(u"check_pivot_sp_weapon")
+
+        self.horizontalLayout_pivot.addWidget(self.check_pivot_sp_weapon)
+
+
+        self.verticalLayout_pivot.addLayout(self.horizontalLayout_pivot)
+
+        self.table_pivot = QTableView(self.tab_pivot)
+        self.table_pivot.setObjectName(u"table_pivot")
+        self.table_pivot.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_pivot.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table_pivot.setSortingEnabled(True)
+        self.table_pivot.verticalHeader().setVisible(False)
+
+        self.verticalLayout_pivot.addWidget(self.table_pivot)
+
+        self.tab_insights.addTab(self.tab_pivot, "")
+        self.tab_neighbors = QWidget()
+        self.tab_neighbors.setObjectName(u"tab_neighbors")
+        self.verticalLayout_neighbors = QVBoxLayout(self.tab_neighbors)
+        self.verticalLayout_neighbors.setObjectName(u"verticalLayout_neighbors")
+        self.label_neighbors = QLabel(self.tab_neighbors)
+        self.label_neighbors.setObjectName(u"label_neighbors")
+        self.label_neighbors.setWordWrap(True)
+
+        self.verticalLayout_neighbors.addWidget(self.label_neighbors)
+
+        self.list_neighbors = QListWidget(self.tab_neighbors)
+        self.list_neighbors.setObjectName(u"list_neighbors")
+        self.list_neighbors.setUniformItemSizes(True)
+
+        self.verticalLayout_neighbors.addWidget(self.list_neighbors)
+
+        self.tab_insights.addTab(self.tab_neighbors, "")
+        self.tab_head_to_head = QWidget()
+        self.tab_head_to_head.setObjectName(u"tab_head_to_head")
+        self.verticalLayout_head_to_head = QVBoxLayout(self.tab_head_to_head)
+        self.verticalLayout_head_to_head.setObjectName(u"verticalLayout_head_to_head")
+        self.label_head_to_head = QLabel(self.tab_head_to_head)
+        self.label_head_to_head.setObjectName(u"label_head_to_head")
+        self.label_head_to_head.setWordWrap(True)
+
+        self.verticalLayout_head_to_head.addWidget(self.label_head_to_head)
+
+        self.button_build_a = QPushButton(self.tab_head_to_head)
+        self.button_build_a.setObjectName(u"button_build_a")
+
+        self.verticalLayout_head_to_head.addWidget(self.button_build_a)
+
+        self.button_build_b = QPushButton(self.tab_head_to_head)
+        self.button_build_b.setObjectName(u"button_build_b")
+
+        self.verticalLayout_head_to_head.addWidget(self.button_build_b)
+
+        self.horizontalLayout_head_to_head = QHBoxLayout()
+        self.horizontalLayout_head_to_head.setObjectName(u"horizontalLayout_head_to_head")
+        self.button_new_pair = QPushButton(self.tab_head_to_head)
+        self.button_new_pair.setObjectName(u"button_new_pair")
+
+        self.horizontalLayout_head_to_head.addWidget(self.button_new_pair)
+
+        self.button_refit = QPushButton(self.tab_head_to_head)
+        self.button_refit.setObjectName(u"button_refit")
+
+        self.horizontalLayout_head_to_head.addWidget(self.button_refit)
+
+
+        self.verticalLayout_head_to_head.addLayout(self.horizontalLayout_head_to_head)
+
+        self.label_rankings = QLabel(self.tab_head_to_head)
+        self.label_rankings.setObjectName(u"label_rankings")
+        self.label_rankings.setWordWrap(True)
+
+        self.verticalLayout_head_to_head.addWidget(self.label_rankings)
+
+        self.list_rankings = QListWidget(self.tab_head_to_head)
+        self.list_rankings.setObjectName(u"list_rankings")
+        self.list_rankings.setUniformItemSizes(True)
+
+        self.verticalLayout_head_to_head.addWidget(self.list_rankings)
+
+        self.tab_insights.addTab(self.tab_head_to_head, "")
+        self.tab_runs = QWidget()
+        self.tab_runs.setObjectName(u"tab_runs")
+        self.verticalLayout_runs = QVBoxLayout(self.tab_runs)
+        self.verticalLayout_runs.setObjectName(u"verticalLayout_runs")
+        self.label_runs = QLabel(self.tab_runs)
+        self.label_runs.setObjectName(u"label_runs")
+        self.label_runs.setWordWrap(True)
+
+        self.verticalLayout_runs.addWidget(self.label_runs)
+
+        self.grid_runs = QGridLayout()
+        self.grid_runs.setObjectName(u"grid_runs")
+        self.label_score = QLabel(self.tab_runs)
+        self.label_score.setObjectName(u"label_score")
+
+        self.grid_runs.addWidget(self.label_score, 0, 0, 1, 1)
+
+        self.spin_score = QSpinBox(self.tab_runs)
+        self.spin_score.setObjectName(u"spin_score")
+        self.spin_score.setGroupSeparatorShown(True)
+        self.spin_score.setMaximum(999999999)
+
+        self.grid_runs.addWidget(self.spin_score, 0, 1, 1, 1)
+
+        self.label_stage = QLabel(self.tab_runs)
+        self.label_stage.setObjectName(u"label_stage")
+
+        self.grid_runs.addWidget(self.label_stage, 0, 2, 1, 1)
+
+        self.spin_stage = QSpinBox(self.tab_runs)
+        self.spin_stage.setObjectName(u"spin_stage")
+        self.spin_stage.setMaximum(99)
+
+        self.grid_runs.addWidget(self.spin_stage, 0, 3, 1, 1)
+
+        self.label_duration = QLabel(self.tab_runs)
+        self.label_duration.setObjectName(u"label_duration")
+
+        self.grid_runs.addWidget(self.label_duration, 1, 0, 1, 1)
+
+        self.time_duration = QTimeEdit(self.tab_runs)
+        self.time_duration.setObjectName(u"time_duration")
+
+        self.grid_runs.addWidget(self.time_duration, 1, 1, 1, 1)
+
+        self.button_log_run = QPushButton(self.tab_runs)
+        self.button_log_run.setObjectName(u"button_log_run")
+
+        self.grid_runs.addWidget(self.button_log_run, 1, 2, 1, 2)
+
+
+        self.verticalLayout_runs.addLayout(self.grid_runs)
+
+        self.label_recent_runs = QLabel(self.tab_runs)
+        self.label_recent_runs.setObjectName(u"label_recent_runs")
+        self.label_recent_runs.setWordWrap(True)
+
+        self.verticalLayout_runs.addWidget(self.label_recent_runs)
+
+        self.list_recent_runs = QListWidget(self.tab_runs)
+        self.list_recent_runs.setObjectName(u"list_recent_runs")
+        self.list_recent_runs.setUniformItemSizes(True)
+
+        self.verticalLayout_runs.addWidget(self.list_recent_runs)
+
+        self.label_top_runs = QLabel(self.tab_runs)
+        self.label_top_runs.setObjectName(u"label_top_runs")
+
+        self.verticalLayout_runs.addWidget(self.label_top_runs)
+
+        self.list_top_runs = QListWidget(self.tab_runs)
+        self.list_top_runs.setObjectName(u"list_top_runs")
+        self.list_top_runs.setUniformItemSizes(True)
+
+        self.verticalLayout_runs.addWidget(self.list_top_runs)
+
+        self.tab_insights.addTab(self.tab_runs, "")
+
+        self.verticalLayout_dock.addWidget(self.tab_insights)
+
+        self.dock_coverage.setWidget(self.dock_coverage_contents)
+        MainWindow.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.dock_coverage)
         self.menubar = QMenuBar(MainWindow)
         self.menubar.setObjectName(u"menubar")
         self.menubar.setGeometry(QRect(0, 0, 958, 22))
+        self.menuFile = QMenu(self.menubar)
+        self.menuFile.setObjectName(u"menuFile")
         self.menuSettings = QMenu(self.menubar)
         self.menuSettings.setObjectName(u"menuSettings")
+        self.menuDatabase = QMenu(self.menuSettings)
+        self.menuDatabase.setObjectName(u"menuDatabase")
+        self.menuView = QMenu(self.menubar)
+        self.menuView.setObjectName(u"menuView")
         self.menuHelp = QMenu(self.menubar)
         self.menuHelp.setObjectName(u"menuHelp")
         MainWindow.setMenuBar(self.menubar)
@@ -583,6 +888,7 @@ class Ui_MainWindow(object):
         self.label_rating.setBuddy(self.box_rating)
         self.label_4.setBuddy(self.box_search_rating)
         self.label.setBuddy(self.box_search_life_forms)
+        self.label_search_notes.setBuddy(self.line_search_notes)
 #endif // QT_CONFIG(shortcut)
         QWidget.setTabOrder(self.tabWidget, self.box_main_shot)
         QWidget.setTabOrder(self.box_main_shot, self.box_option_shot)
@@ -595,9 +901,15 @@ class Ui_MainWindow(object):
         QWidget.setTabOrder(self.table, self.box_sp_weapon_0)
         QWidget.setTabOrder(self.box_sp_weapon_0, self.box_eyes_0)
 
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuView.menuAction())
         self.menubar.addAction(self.menuSettings.menuAction())
         self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuFile.addAction(self.action_import)
+        self.menuFile.addAction(self.action_export)
         self.menuSettings.addAction(self.action_dark_mode)
+        self.menuSettings.addAction(self.menuDatabase.menuAction())
+        self.menuDatabase.addAction(self.action_database_info)
         self.menuHelp.addAction(self.action_about)
         self.menuHelp.addAction(self.action_about_qt)
 
@@ -614,6 +926,9 @@ class Ui_MainWindow(object):
         self.action_dark_mode.setText(QCoreApplication.translate("MainWindow", u"Dark Mode", None))
         self.action_about.setText(QCoreApplication.translate("MainWindow", u"About", None))
         self.action_about_qt.setText(QCoreApplication.translate("MainWindow", u"About Qt", None))
+        self.action_import.setText(QCoreApplication.translate("MainWindow", u"Import...", None))
+        self.action_export.setText(QCoreApplication.translate("MainWindow", u"Export...", None))
+        self.action_database_info.setText(QCoreApplication.translate("MainWindow", u"Active Profile...", None))
         self.group_wonderful.setTitle(QCoreApplication.translate("MainWindow", u"Wonderful Life Forms", None))
         self.label_sp_weapon_0.setText(QCoreApplication.translate("MainWindow", u"Special Weapon", None))
         self.label_eyes_0.setText(QCoreApplication.translate("MainWindow", u"Clone Eyes", None))
@@ -739,13 +1054,52 @@ class Ui_MainWindow(object):
         self.button_update.setText(QCoreApplication.translate("MainWindow", u"Update Life Form", None))
         self.button_remove.setText(QCoreApplication.translate("MainWindow", u"Remove Life Form", None))
         self.button_remove_all.setText(QCoreApplication.translate("MainWindow", u"Remove All", None))
+        self.dock_coverage.setWindowTitle(QCoreApplication.translate("MainWindow", u"Builds", None))
+        ___qtablewidgetitem = self.table_coverage.horizontalHeaderItem(0)
+        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"Tested", None));
+        ___qtablewidgetitem1 = self.table_coverage.horizontalHeaderItem(1)
+        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"Untested", None));
+        ___qtablewidgetitem2 = self.table_coverage.horizontalHeaderItem(2)
+        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"Coverage", None));
+        self.label_untested.setText(QCoreApplication.translate("MainWindow", u"Untested builds", None))
+        self.tab_insights.setTabText(self.tab_insights.indexOf(self.tab_coverage), QCoreApplication.translate("MainWindow", u"Coverage", None))
+        self.label_heatmap.setText(QCoreApplication.translate("MainWindow", u"Mean rating", None))
+        self.tab_insights.setTabText(self.tab_insights.indexOf(self.tab_heatmap), QCoreApplication.translate("MainWindow", u"Heatmap", None))
+        self.label_suggestions.setText(QCoreApplication.translate("MainWindow", u"Suggested next builds", None))
+        self.tab_insights.setTabText(self.tab_insights.indexOf(self.tab_suggestions), QCoreApplication.translate("MainWindow", u"Suggestions", None))
+        self.label_pivot.setText(QCoreApplication.translate("MainWindow", u"Mean rating by", None))
+        self.check_pivot_life_form.setText(QCoreApplication.translate("MainWindow", u"Life Form", None))
+        self.check_pivot_main_shot.setText(QCoreApplication.translate("MainWindow", u"Main Shot", None))
+        self.check_pivot_option_shot.setText(QCoreApplication.translate("MainWindow", u"Option Shot", None))
+        self.check_pivot_clone_eyes.setText(QCoreApplication.translate("MainWindow", u"Clone Eyes", None))
+        self.check_pivot_sp_weapon.setText(QCoreApplication.translate("MainWindow", u"Special Weapon", None))
+        self.tab_insights.setTabText(self.tab_insights.indexOf(self.tab_pivot), QCoreApplication.translate("MainWindow", u"Pivot", None))
+        self.label_neighbors.setText(QCoreApplication.translate("MainWindow", u"Builds one swap away", None))
+        self.tab_insights.setTabText(self.tab_insights.indexOf(self.tab_neighbors), QCoreApplication.translate("MainWindow", u"Neighbors", None))
+        self.label_head_to_head.setText(QCoreApplication.translate("MainWindow", u"Which build is better?", None))
+        self.button_new_pair.setText(QCoreApplication.translate("MainWindow", u"Another Pair", None))
+        self.button_refit.setText(QCoreApplication.translate("MainWindow", u"Refit Rankings", None))
+        self.label_rankings.setText(QCoreApplication.translate("MainWindow", u"Rankings", None))
+        self.tab_insights.setTabText(self.tab_insights.indexOf(self.tab_head_to_head), QCoreApplication.translate("MainWindow", u"Head to Head", None))
+        self.label_runs.setText(QCoreApplication.translate("MainWindow", u"Runs", None))
+        self.label_score.setText(QCoreApplication.translate("MainWindow", u"Score", None))
+        self.label_stage.setText(QCoreApplication.translate("MainWindow", u"Stage", None))
+        self.spin_stage.setSpecialValueText(QCoreApplication.translate("MainWindow", u"-", None))
+        self.label_duration.setText(QCoreApplication.translate("MainWindow", u"Time", None))
+        self.time_duration.setDisplayFormat(QCoreApplication.translate("MainWindow", u"H:mm:ss", None))
+        self.button_log_run.setText(QCoreApplication.translate("MainWindow", u"Log Run", None))
+        self.label_recent_runs.setText(QCoreApplication.translate("MainWindow", u"Latest runs", None))
+        self.label_top_runs.setText(QCoreApplication.translate("MainWindow", u"Best scores", None))
+        self.tab_insights.setTabText(self.tab_insights.indexOf(self.tab_runs), QCoreApplication.translate("MainWindow", u"Runs", None))
         self.group_search.setTitle(QCoreApplication.translate("MainWindow", u"Wonderful Life Form Database", None))
         self.label_4.setText(QCoreApplication.translate("MainWindow", u"Overall Rating", None))
         self.button_search.setText(QCoreApplication.translate("MainWindow", u"Search", None))
+        self.label_search_notes.setText(QCoreApplication.translate("MainWindow", u"Notes", None))
+        self.line_search_notes.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Search notes", None))
         self.label.setText(QCoreApplication.translate("MainWindow", u"Wonder Life Forms", None))
         self.box_search_life_forms.setItemText(0, QCoreApplication.translate("MainWindow", u"All", None))
         self.box_search_life_forms.setItemText(1, QCoreApplication.translate("MainWindow", u"Cyclopyge Unbonata", None))
-        self.box_search_life_forms.setItemText(2, QCoreApplication.translate("MainWindow", u"Marrella Splendense", None))
+        self.box_search_life_forms.setItemText(2, QCoreApplication.translate("MainWindow", u"Marrella Splendens", None))
         self.box_search_life_forms.setItemText(3, QCoreApplication.translate("MainWindow", u"Hallucigenia Sparsa", None))
         self.box_search_life_forms.setItemText(4, QCoreApplication.translate("MainWindow", u"Sarotrocercus Oblita", None))
         self.box_search_life_forms.setItemText(5, QCoreApplication.translate("MainWindow", u"Burgessia Bella", None))
@@ -757,7 +1111,10 @@ class Ui_MainWindow(object):
         self.box_search_rating.setItemText(2, QCoreApplication.translate("MainWindow", u"2: Good", None))
         self.box_search_rating.setItemText(3, QCoreApplication.translate("MainWindow", u"3: Great", None))
 
+        self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"File", None))
+        self.menuView.setTitle(QCoreApplication.translate("MainWindow", u"View", None))
         self.menuSettings.setTitle(QCoreApplication.translate("MainWindow", u"Settings", None))
+        self.menuDatabase.setTitle(QCoreApplication.translate("MainWindow", u"Database", None))
         self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", u"About", None))
     # retranslateUi
 
@@ -0,0 +1,281 @@
+import time
+from PySide6.QtSql import QSqlQuery
+from lookups import LOOKUPS
+
+# databases carry their schema version in PRAGMA user_version, 0 is a brand new file or one made before versioning
+# (those already have the text lifeforms table, which is why version 1 only creates it if it's missing)
+# to change the schema add a new (version, name, statements) step to the end of MIGRATIONS, never edit an old one
+
+class MigrationError(Exception):
+    pass
+
+LOOKUP_TABLES = dict(LOOKUPS.values()) # lookup table name -> {code: label}
+
+LIFEFORMS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        life_form INTEGER REFERENCES life_forms (code),
+        main_shot INTEGER REFERENCES shots (code),
+        option_shot INTEGER REFERENCES shots (code),
+        clone_eyes INTEGER REFERENCES clone_eyes (code),
+        sp_weapon INTEGER REFERENCES sp_weapons (code),
+        rating INTEGER REFERENCES ratings (code),
+        notes TEXT
+    )
+    """
+
+# every index ends in the rowid, so each filter combination can walk its rows in id order for the table pages
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_lifeforms_life_form_rating ON lifeforms (life_form, rating)",
+    "CREATE INDEX IF NOT EXISTS idx_lifeforms_life_form ON lifeforms (life_form)", # without it a life form only search sorts every match on each page
+    "CREATE INDEX IF NOT EXISTS idx_lifeforms_rating ON lifeforms (rating)",
+]
+
+def lookup_statements(): # the code -> label tables, kept so the database still makes sense on its own
+    statements = []
+    for table, labels in LOOKUP_TABLES.items():
+        statements.append(f"CREATE TABLE IF NOT EXISTS {table} (code INTEGER PRIMARY KEY, label TEXT NOT NULL UNIQUE)")
+        statements += [f"INSERT OR REPLACE INTO {table} (code, label) VALUES ({code}, '{label}')" for code, label in labels.items()]
+    return statements
+
+# the table as the first versions of the app made it, every label stored as text
+TEXT_LIFEFORMS_TABLE = """
+    CREATE TABLE IF NOT EXISTS lifeforms (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        life_form TEXT,
+        main_shot TEXT,
+        option_shot TEXT,
+        clone_eyes TEXT,
+        sp_weapon TEXT,
+        rating TEXT,
+        notes TEXT
+    )
+    """
+
+# a label that doesn't match anything comes through as a NULL code, older versions let any text be typed into the table
+LABEL_LOST = "nullif(trim(old.{0}), '') IS NOT NULL AND new.{0} IS NULL"
+CODED_COLUMNS = ('life_form', 'main_shot', 'option_shot', 'clone_eyes', 'sp_weapon', 'rating')
+
+# rewrites the text table into integer codes, in place
+# trim() is there because older versions wrote the padded table text back on update
+# the rows that lost a label are kept as they were in lifeforms_v1, so that text can still be recovered
+INTEGER_CODES = lookup_statements() + [
+    LIFEFORMS_TABLE.format(name='lifeforms_v2'),
+    """
+    INSERT INTO lifeforms_v2 (id, life_form, main_shot, option_shot, clone_eyes, sp_weapon, rating, notes)
+    SELECT old.id, life_forms.code, main_shots.code, option_shots.code, clone_eyes.code, sp_weapons.code, ratings.code, trim(old.notes)
+    FROM lifeforms AS old
+    LEFT JOIN life_forms ON life_forms.label = trim(old.life_form)
+    LEFT JOIN shots AS main_shots ON main_shots.label = trim(old.main_shot)
+    LEFT JOIN shots AS option_shots ON option_shots.label = trim(old.option_shot)
+    LEFT JOIN clone_eyes ON clone_eyes.label = trim(old.clone_eyes)
+    LEFT JOIN sp_weapons ON sp_weapons.label = trim(old.sp_weapon)
+    LEFT JOIN ratings ON ratings.label = trim(old.rating)
+    """,
+    "ALTER TABLE lifeforms RENAME TO lifeforms_v1",
+    f"""
+    DELETE FROM lifeforms_v1 WHERE id NOT IN (
+        SELECT old.id FROM lifeforms_v1 AS old JOIN lifeforms_v2 AS new ON new.id = old.id
+        WHERE {' OR '.join(LABEL_LOST.format(column) for column in CODED_COLUMNS)}
+    )
+    """,
+    "ALTER TABLE lifeforms_v2 RENAME TO lifeforms",
+] + INDEXES
+
+# an external content FTS5 index over the notes, it only stores the index and reads the text back out of lifeforms
+# the triggers keep it in step with every insert, update and delete, whoever makes them
+NOTES_INDEX = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS lifeforms_fts USING fts5(notes, content='lifeforms', content_rowid='id')",
+    """
+    CREATE TRIGGER IF NOT EXISTS lifeforms_fts_insert AFTER INSERT ON lifeforms BEGIN
+        INSERT INTO lifeforms_fts (rowid, notes) VALUES (new.id, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS lifeforms_fts_delete AFTER DELETE ON lifeforms BEGIN
+        INSERT INTO lifeforms_fts (lifeforms_fts, rowid, notes) VALUES ('delete', old.id, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS lifeforms_fts_update AFTER UPDATE OF notes ON lifeforms BEGIN
+        INSERT INTO lifeforms_fts (lifeforms_fts, rowid, notes) VALUES ('delete', old.id, old.notes);
+        INSERT INTO lifeforms_fts (rowid, notes) VALUES (new.id, new.notes);
+    END
+    """,
+    "INSERT INTO lifeforms_fts (lifeforms_fts) VALUES ('rebuild')", # indexes the notes already in the table
+]
+
+# running totals per build, so stats can be read from one row per build instead of every run
+# rows with a missing code aren't counted, and a build's row goes away again when its last run is deleted
+BUILD_KEY = "life_form, main_shot, option_shot, clone_eyes, sp_weapon"
+BUILD_COMPLETE = "{0}.life_form IS NOT NULL AND {0}.main_shot IS NOT NULL AND {0}.option_shot IS NOT NULL AND {0}.clone_eyes IS NOT NULL AND {0}.sp_weapon IS NOT NULL"
+BUILD_MATCHES = "life_form = {0}.life_form AND main_shot = {0}.main_shot AND option_shot = {0}.option_shot AND clone_eyes = {0}.clone_eyes AND sp_weapon = {0}.sp_weapon"
+
+def count_run(row): # adds one run to the totals
+    return f"""
+        INSERT INTO combo_stats ({BUILD_KEY}, runs, rating_sum, bad, good, great, updated_at)
+        VALUES ({row}.life_form, {row}.main_shot, {row}.option_shot, {row}.clone_eyes, {row}.sp_weapon,
+                1, coalesce({row}.rating, 0), {row}.rating IS 1, {row}.rating IS 2, {row}.rating IS 3, CURRENT_TIMESTAMP)
+        ON CONFLICT ({BUILD_KEY}) DO UPDATE SET
+            runs = runs + 1, rating_sum = rating_sum + excluded.rating_sum,
+            bad = bad + excluded.bad, good = good + excluded.good, great = great + excluded.great,
+            updated_at = excluded.updated_at;
+        """
+
+def uncount_run(row): # takes one run back out
+    return f"""
+        UPDATE combo_stats SET
+            runs = runs - 1, rating_sum = rating_sum - coalesce({row}.rating, 0),
+            bad = bad - ({row}.rating IS 1), good = good - ({row}.rating IS 2), great = great - ({row}.rating IS 3),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE {BUILD_MATCHES.format(row)};
+        DELETE FROM combo_stats WHERE {BUILD_MATCHES.format(row)} AND runs = 0;
+        """
+
+COMBO_STATS = [
+    f"""
+    CREATE TABLE IF NOT EXISTS combo_stats (
+        life_form INTEGER NOT NULL,
+        main_shot INTEGER NOT NULL,
+        option_shot INTEGER NOT NULL,
+        clone_eyes INTEGER NOT NULL,
+        sp_weapon INTEGER NOT NULL,
+        runs INTEGER NOT NULL,
+        rating_sum INTEGER NOT NULL,
+        bad INTEGER NOT NULL,
+        good INTEGER NOT NULL,
+        great INTEGER NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY ({BUILD_KEY})
+    ) WITHOUT ROWID
+    """,
+    "DELETE FROM combo_stats", # the totals are always rebuilt from scratch, like the notes index
+    f"""
+    INSERT INTO combo_stats ({BUILD_KEY}, runs, rating_sum, bad, good, great, updated_at)
+    SELECT {BUILD_KEY}, count(*), total(rating), total(rating IS 1), total(rating IS 2), total(rating IS 3), CURRENT_TIMESTAMP
+    FROM lifeforms AS new WHERE {BUILD_COMPLETE.format('new')}
+    GROUP BY {BUILD_KEY}
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS combo_stats_insert AFTER INSERT ON lifeforms WHEN {BUILD_COMPLETE.format('new')} BEGIN
+        {count_run('new')}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS combo_stats_delete AFTER DELETE ON lifeforms WHEN {BUILD_COMPLETE.format('old')} BEGIN
+        {uncount_run('old')}
+    END
+    """,
+    # an update is the old run taken out and the new one counted, split in two so each half can check its own row
+    f"""
+    CREATE TRIGGER IF NOT EXISTS combo_stats_update_old AFTER UPDATE OF {BUILD_KEY}, rating ON lifeforms WHEN {BUILD_COMPLETE.format('old')} BEGIN
+        {uncount_run('old')}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS combo_stats_update_new AFTER UPDATE OF {BUILD_KEY}, rating ON lifeforms WHEN {BUILD_COMPLETE.format('new')} BEGIN
+        {count_run('new')}
+    END
+    """,
+]
+
+# head to head results between two builds and the rankings worked out from them (see ranking.py)
+# builds are stored packed (see combos.py), comparisons are never deleted so the Bradley-Terry refit can always start over from them
+HEAD_TO_HEAD = [
+    """
+    CREATE TABLE IF NOT EXISTS comparisons (
+        id INTEGER PRIMARY KEY,
+        winner INTEGER NOT NULL,
+        loser INTEGER NOT NULL,
+        compared_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS build_scores (
+        build INTEGER PRIMARY KEY,
+        elo REAL NOT NULL,
+        comparisons INTEGER NOT NULL,
+        strength REAL
+    )
+    """, # strength is the last Bradley-Terry fit on the Elo scale, NULL until the first refit
+]
+
+# every run played, for score history; builds are packed like in build_scores
+# the indexes answer "latest runs of a build" and "best scores" straight off the index, however many runs there are
+RUN_LOG = [
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY,
+        build INTEGER NOT NULL,
+        played_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        score INTEGER NOT NULL,
+        stage INTEGER,
+        seconds INTEGER
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_runs_build_played_at ON runs (build, played_at)",
+    "CREATE INDEX IF NOT EXISTS idx_runs_score ON runs (score DESC)",
+]
+
+MIGRATIONS = [
+    (1, "lifeforms table", [TEXT_LIFEFORMS_TABLE]),
+    (2, "integer codes and search indexes", INTEGER_CODES),
+    (3, "notes full text index", NOTES_INDEX),
+    (4, "combo stats", COMBO_STATS),
+    (5, "head to head rankings", HEAD_TO_HEAD),
+    (6, "run log", RUN_LOG),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+SCHEMA = [statement for _, _, statements in MIGRATIONS for statement in statements] # everything it takes to build a fresh database
+
+MIGRATION_LOG_TABLE = """
+    CREATE TABLE IF NOT EXISTS migration_log (
+        version INTEGER PRIMARY KEY,
+        name TEXT,
+        seconds REAL,
+        applied_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+    """
+
+def schema_version(database):
+    query = QSqlQuery("PRAGMA user_version", database)
+    query.next()
+    return query.value(0)
+
+def unmatched_rows(database): # how many rows migration 2 kept in lifeforms_v1, 0 if there's no such table
+    query = QSqlQuery("SELECT count(*) FROM lifeforms_v1", database)
+    return query.value(0) if query.next() else 0
+
+def migrate(database): # brings the database up to SCHEMA_VERSION and returns [(version, name, seconds)] for the steps it ran
+    pending = [step for step in MIGRATIONS if step[0] > schema_version(database)]
+    if not pending:
+        return []
+
+    # all the steps share one transaction, so if any of them fails the file is left exactly as it was
+    query = QSqlQuery(database)
+    database.transaction()
+    timings = []
+    for version, name, statements in pending:
+        start = time.perf_counter()
+        for statement in statements:
+            if not query.exec(statement):
+                error = query.lastError().text()
+                query.finish()
+                database.rollback()
+                raise MigrationError(f"Migration {version} ({name}) failed: {error}")
+        timings.append((version, name, time.perf_counter() - start))
+
+    query.exec(MIGRATION_LOG_TABLE)
+    for version, name, seconds in timings: # keep a record of how long each step took on this database
+        query.prepare("INSERT OR REPLACE INTO migration_log (version, name, seconds) VALUES (?, ?, ?)")
+        query.addBindValue(version)
+        query.addBindValue(name)
+        query.addBindValue(seconds)
+        query.exec()
+    query.exec(f"PRAGMA user_version = {pending[-1][0]}")
+    query.finish()
+    if not database.commit():
+        database.rollback()
+        raise MigrationError(f"Could not save the database upgrade: {database.lastError().text()}")
+    return timings
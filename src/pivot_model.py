@@ -0,0 +1,77 @@
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from lookups import label
+
+SLOT_HEADERS = ['Life Form', 'Main Shot', 'Option Shot', 'Clone Eyes', 'Special Weapon'] # same order as the cube axes in ratings.py
+
+class PivotTableModel(QAbstractTableModel): # one row per filled cell of a RatingStats pivot, the slot labels then mean and rated runs
+    # nothing is copied into items, the view reads straight out of the NumPy arrays and sorting only reorders the row index
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.slots = ()
+        self.means = np.full((), np.nan)
+        self.counts = np.zeros((), dtype=np.int64)
+        self.cells = np.zeros(0, dtype=np.int64) # flat indexes into means/counts, in display order
+        self.sort_column = None
+        self.sort_order = Qt.SortOrder.AscendingOrder
+
+    def set_pivot(self, slots, means, counts): # slots in axis order, as passed to RatingStats.pivot
+        self.beginResetModel()
+        self.slots = tuple(sorted(slots))
+        self.means = means
+        self.counts = counts
+        self.cells = np.flatnonzero(counts.ravel() > 0) # cells nobody has rated are left out
+        self.order_cells()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.cells)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.slots) + 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.ItemDataRole.TextAlignmentRole and column >= len(self.slots):
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        cell = self.cells[index.row()]
+        if column < len(self.slots):
+            code = np.unravel_index(cell, self.counts.shape)[column]
+            return '  '+label(self.slots[column], int(code))+'  '
+        if column == len(self.slots):
+            return f"{self.means.flat[cell]:.2f}"
+        return f"{self.counts.flat[cell]:,}"
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return ([SLOT_HEADERS[slot] for slot in self.slots] + ['Mean', 'Runs'])[section]
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self.sort_column = column
+        self.sort_order = order
+        self.order_cells()
+        self.layoutChanged.emit()
+
+    def order_cells(self): # a stable argsort over whichever array the sort column reads from
+        if self.sort_column is None or self.sort_column >= len(self.slots) + 2 or not len(self.cells):
+            return
+        if self.sort_column < len(self.slots):
+            keys = np.unravel_index(self.cells, self.counts.shape)[self.sort_column]
+        elif self.sort_column == len(self.slots):
+            keys = self.means.flat[self.cells]
+        else:
+            keys = self.counts.flat[self.cells]
+        if self.sort_order == Qt.SortOrder.DescendingOrder:
+            keys = -keys
+        self.cells = self.cells[np.argsort(keys, kind='stable')]
@@ -0,0 +1,95 @@
+from PySide6.QtSql import QSqlDatabase, QSqlQuery
+
+# connection settings applied every time a connection to the database is opened
+# journal_mode is stored in the file itself, the rest only last as long as the connection
+
+PROFILES = {
+    # write ahead log, commits don't wait on an fsync (a power cut can lose the last few adds but never corrupts the file)
+    'tuned': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -32000, # negative is KiB, so about 32 MB
+        'temp_store': 'MEMORY',
+        'mmap_size': 268435456, # reads come straight out of the page cache for the first 256 MB of the file
+    },
+    # write ahead log but every commit is synced to disk
+    'safe': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'cache_size': -32000,
+        'temp_store': 'MEMORY',
+        'mmap_size': 0,
+    },
+    # what SQLite does out of the box, a rollback journal and a full sync on every commit
+    'default': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'cache_size': -2000,
+        'temp_store': 'DEFAULT',
+        'mmap_size': 0,
+    },
+}
+
+DEFAULT_PROFILE = 'tuned'
+
+PROFILE_NAMES = {
+    'tuned': "Tuned (WAL, normal sync)",
+    'safe': "Safe (WAL, full sync)",
+    'default': "SQLite Defaults (rollback journal)",
+}
+
+def profile_name(profile): # falls back to the default profile for anything unknown, e.g. a hand edited settings.ini
+    return profile if profile in PROFILES else DEFAULT_PROFILE
+
+def apply_profile(database, profile): # sets every PRAGMA in the profile on an open connection and returns what SQLite reports back
+    query = QSqlQuery(database)
+    for pragma, value in PROFILES[profile_name(profile)].items():
+        query.exec(f"PRAGMA {pragma} = {value}")
+    query.finish()
+    return read_pragmas(database)
+
+def read_pragmas(database): # {pragma: value} as the connection has them right now
+    pragmas = {}
+    query = QSqlQuery(database)
+    for pragma in PROFILES[DEFAULT_PROFILE]:
+        query.exec(f"PRAGMA {pragma}")
+        if query.next():
+            pragmas[pragma] = query.value(0)
+    query.finish()
+    return pragmas
+
+class OpenError(Exception):
+    pass
+
+class Connection: # a named QSQLITE connection with a profile applied, used as a with block or opened and closed by hand like the worker does
+    # Qt only removes a connection once nothing holds it, so the handle lives on here as connection.database and is let go of in close()
+    # (a LifeformRepository on it has to be closed first, see LifeformRepository.close)
+    def __init__(self, path, name, profile=DEFAULT_PROFILE):
+        self.path = path
+        self.name = name
+        self.profile = profile
+        self.database = None
+        self.pragmas = {} # what SQLite reported back for the profile
+
+    def open(self): # raises OpenError if the file can't be opened
+        self.database = QSqlDatabase.addDatabase("QSQLITE", self.name)
+        self.database.setDatabaseName(self.path)
+        if not self.database.open():
+            error = self.database.lastError().text()
+            self.close()
+            raise OpenError(error)
+        self.pragmas = apply_profile(self.database, self.profile)
+        return self
+
+    def close(self):
+        if self.database is None:
+            return
+        self.database.close()
+        self.database = None
+        QSqlDatabase.removeDatabase(self.name)
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exception):
+        self.close()
@@ -0,0 +1,70 @@
+import numpy as np
+from combos import RADIX, BUILDS, pack_build
+
+# predicts the rating of any build as the sum of one effect per part:
+#   rating ~ mean + life_form + main_shot + option_shot + clone_eyes + sp_weapon
+# fitted by least squares over every rated run. The fit only needs the normal equations (A = XᵀX, b = Xᵀy),
+# and each run adds one outer product to them, so a new entry costs a rank one update and a 27 x 27 solve
+
+RIDGE = 1.0 # pulls effects with little data behind them towards zero, also keeps A solvable before every part has been rated
+SUGGESTIONS = 20
+
+def design_matrix(): # one row per packed build, a 1 for the mean and a one hot block per slot
+    codes = np.arange(BUILDS)
+    digits = []
+    for radix in reversed(RADIX):
+        codes, digit = np.divmod(codes, radix)
+        digits.append(digit)
+    digits.reverse()
+    blocks = [np.ones((BUILDS, 1))] + [np.eye(radix)[digit] for digit, radix in zip(digits, RADIX)]
+    return np.hstack(blocks)
+
+class BuildPredictor:
+    def __init__(self):
+        self.X = design_matrix() # 3,456 x 27
+        penalty = np.full(self.X.shape[1], RIDGE)
+        penalty[0] = 0 # the mean isn't shrunk
+        self.penalty = np.diag(penalty)
+        self.clear()
+
+    def clear(self):
+        self.A = self.penalty.copy()
+        self.b = np.zeros(self.X.shape[1])
+        self.runs = 0
+        self.effects = None # solved lazily, None means A or b changed since
+
+    def fit(self, counts, sums): # from the per build totals in RatingStats, n runs of a build count as n rows of X
+        self.A = self.X.T @ (counts[:, None] * self.X) + self.penalty
+        self.b = self.X.T @ sums
+        self.runs = int(counts.sum())
+        self.effects = None
+
+    def add(self, record, sign=1): # one rated run, the incremental part of the fit
+        build = pack_build(record[:5])
+        if build is None or record.rating is None:
+            return
+        x = self.X[build]
+        self.A += sign * np.outer(x, x)
+        self.b += sign * record.rating * x
+        self.runs += sign
+        self.effects = None
+
+    def remove(self, record):
+        self.add(record, sign=-1)
+
+    def predict(self): # predicted rating for every packed build
+        if self.effects is None:
+            self.effects = np.linalg.solve(self.A, self.b)
+        return self.X @ self.effects
+
+    def suggestions(self, tested, count=SUGGESTIONS): # [(packed build, predicted rating)] for the best builds that haven't been tried, best first
+        if self.runs == 0:
+            return []
+        predicted = self.predict()
+        untested = np.flatnonzero(~tested)
+        if untested.size == 0:
+            return []
+        count = min(count, untested.size)
+        best = untested[np.argpartition(-predicted[untested], count - 1)[:count]]
+        best = best[np.argsort(-predicted[best], kind='stable')]
+        return [(int(build), float(predicted[build])) for build in best]
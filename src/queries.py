@@ -0,0 +1,34 @@
+def search_filter(life_form=None, rating=None): # builds a WHERE clause out of only the filters that are set (as codes), None means All/Any
+    terms = []
+    values = []
+    if life_form is not None:
+        terms.append("life_form = ?")
+        values.append(life_form)
+    if rating is not None:
+        terms.append("rating = ?")
+        values.append(rating)
+    return " AND ".join(terms), values
+
+def page_sql(where=''): # one keyset page of the lifeforms table, bind the filter values then the last id and the page size
+    where = f"WHERE {where} AND id > ?" if where else "WHERE id > ?"
+    return f"SELECT * FROM lifeforms {where} ORDER BY id LIMIT ?"
+
+def notes_page_sql(where=''): # one page of a notes search, best bm25 match first
+    # ranked results can't be keyset on id, so these page with OFFSET, bind the match, the filter values, then the page size and offset
+    where = f"AND {where}" if where else ""
+    return f"""
+        SELECT lifeforms.* FROM lifeforms_fts JOIN lifeforms ON lifeforms.id = lifeforms_fts.rowid
+        WHERE lifeforms_fts MATCH ? {where}
+        ORDER BY bm25(lifeforms_fts), lifeforms.id LIMIT ? OFFSET ?
+        """
+
+def count_sql(where='', notes=False): # how many rows a search finds, bind the notes match (if there is one) then the filter values
+    if notes:
+        where = f"AND {where}" if where else ""
+        return f"SELECT count(*) FROM lifeforms_fts JOIN lifeforms ON lifeforms.id = lifeforms_fts.rowid WHERE lifeforms_fts MATCH ? {where}"
+    where = f"WHERE {where}" if where else ""
+    return f"SELECT count(*) FROM lifeforms {where}"
+
+def notes_match(text): # turns what was typed into an FTS5 query, every word has to match the start of a word in the notes
+    words = text.replace('"', ' ').split()
+    return " ".join(f'"{word}"*' for word in words)
@@ -0,0 +1,77 @@
+import numpy as np
+from combos import BUILDS
+
+# head to head rankings, for telling apart builds that all got rated 3: Great
+# every comparison moves two Elo scores straight away, and a Bradley-Terry fit over every comparison ever made can be run now and then
+# both come out on the same scale: a 400 point gap means the higher build should win 10 times out of 11
+
+ELO_START = 1500.0
+ELO_K = 32.0 # how far one result moves a score
+BT_ITERATIONS = 500
+BT_TOLERANCE = 1e-9
+PAIR_POOL = 50 # head to head picks its pairs from this many of the best rated builds
+RANKINGS = 20
+
+def expected_score(score, other): # chance of a build with score beating one with other
+    return 1 / (1 + 10 ** ((other - score) / 400))
+
+def elo_update(winner, loser, k=ELO_K): # new (winner, loser) scores after one comparison, the points won are the points lost
+    change = k * (1 - expected_score(winner, loser))
+    return winner + change, loser - change
+
+def bradley_terry(winners, losers, iterations=BT_ITERATIONS, tolerance=BT_TOLERANCE):
+    # strengths for every packed build from two arrays of packed builds, one entry per comparison, fitted with the MM algorithm (Hunter 2004)
+    # each compared build also gets one win and one loss against an average build, which keeps builds that never lost (or never won) finite
+    # comes back on the Elo scale with nan for builds that were never compared
+    compared = np.zeros(BUILDS, dtype=bool)
+    compared[winners] = True
+    compared[losers] = True
+    wins = np.bincount(winners, minlength=BUILDS) + 1.0
+    strength = np.ones(BUILDS)
+    for _ in range(iterations):
+        pair = 1 / (strength[winners] + strength[losers])
+        games = np.bincount(winners, weights=pair, minlength=BUILDS) + np.bincount(losers, weights=pair, minlength=BUILDS)
+        games += 2 / (strength + 1) # the two games against the average build, whose strength is 1
+        updated = np.where(compared, wins / games, 1.0)
+        change = np.abs(updated - strength).max()
+        strength = updated
+        if change < tolerance:
+            break
+    return np.where(compared, ELO_START + 400 * np.log10(strength), np.nan)
+
+class BuildRanking: # Elo scores and the last Bradley-Terry fit for every packed build, kept by the window and loaded from build_scores
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.elo = np.full(BUILDS, ELO_START)
+        self.comparisons = np.zeros(BUILDS, dtype=np.int64) # how many head to heads each build has been in
+        self.strength = np.full(BUILDS, np.nan)
+
+    def load(self, rows): # (build, elo, comparisons, strength) rows from build_scores, strength can be None
+        self.clear()
+        for build, elo, comparisons, strength in rows:
+            self.elo[build] = elo
+            self.comparisons[build] = comparisons
+            self.strength[build] = np.nan if strength is None else strength
+
+    def set_elo(self, build, elo, comparisons):
+        self.elo[build] = elo
+        self.comparisons[build] = comparisons
+
+    def pair(self, pool, rng): # two builds from the pool, the one compared least so far and whoever's score is closest to it
+        # close scores are the comparisons that tell the most, or None if the pool doesn't have two builds in it
+        if len(pool) < 2:
+            return None
+        pool = np.asarray(pool)
+        fewest = pool[self.comparisons[pool] == self.comparisons[pool].min()]
+        first = rng.choice(fewest)
+        others = pool[pool != first]
+        gaps = np.abs(self.elo[others] - self.elo[first])
+        second = rng.choice(others[gaps == gaps.min()])
+        return int(first), int(second)
+
+    def top(self, count=RANKINGS): # [(build, elo, strength)] for the builds that have been compared, best Elo first
+        compared = np.flatnonzero(self.comparisons > 0)
+        best = compared[np.argsort(-self.elo[compared], kind='stable')][:count]
+        return [(int(build), float(self.elo[build]), float(self.strength[build])) for build in best]
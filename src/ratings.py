@@ -0,0 +1,57 @@
+import numpy as np
+from combos import RADIX, BUILDS, pack_build
+
+# rating totals for every build, kept as two flat NumPy arrays indexed by the packed build (see combos.py)
+# reshaped to RADIX they're a five dimensional cube with one axis per slot, and every pivot (the heatmaps included)
+# is a sum over the axes that aren't wanted, so nothing ever goes back to SQL per cell
+
+class RatingStats:
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.counts = np.zeros(BUILDS, dtype=np.int64) # rated runs per build
+        self.sums = np.zeros(BUILDS, dtype=np.int64) # their ratings added up
+        self.changed()
+
+    def changed(self): # call after touching counts or sums, the cached pivots were worked out from the old totals
+        self.version = getattr(self, 'version', 0) + 1
+        self.pivots = {} # (slot, ...) -> (means, counts), only good for this version
+
+    def load(self, builds, counts, sums): # three integer arrays, one entry per build with totals (the rows of combo_stats), spread out here in one pass each
+        self.counts = np.bincount(builds, weights=counts, minlength=BUILDS).astype(np.int64)
+        self.sums = np.bincount(builds, weights=sums, minlength=BUILDS).astype(np.int64)
+        self.changed()
+
+    def add(self, record, sign=1): # one LifeformRecord, rows without a rating or with an unknown code don't count
+        build = pack_build(record[:5])
+        if build is None or record.rating is None:
+            return
+        self.counts[build] += sign
+        self.sums[build] += sign * record.rating
+        self.changed()
+
+    def remove(self, record):
+        self.add(record, sign=-1)
+
+    def life_form(self, life_form): # (counts, sums) shaped main_shot x option_shot x clone_eyes x sp_weapon
+        return self.counts.reshape(RADIX)[life_form], self.sums.reshape(RADIX)[life_form]
+
+    def pivot(self, slots): # (means, counts) by the given slots (0 life_form ... 4 sp_weapon), one axis per slot in that order
+        # means are nan where nothing was rated, no slots at all rolls everything up into a single cell
+        slots = tuple(sorted(slots))
+        if slots not in self.pivots:
+            others = tuple(axis for axis in range(len(RADIX)) if axis not in slots)
+            counts = self.counts.reshape(RADIX).sum(axis=others)
+            sums = self.sums.reshape(RADIX).sum(axis=others)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = np.where(counts > 0, sums / counts, np.nan)
+            self.pivots[slots] = (means, counts)
+        return self.pivots[slots]
+
+    def heatmaps(self, life_form): # ((means, counts) for main x option, (means, counts) for eyes x weapon), means are nan where nothing was rated
+        maps = []
+        for slots in ((0, 1, 2), (0, 3, 4)):
+            means, counts = self.pivot(slots)
+            maps.append((means[life_form], counts[life_form]))
+        return maps
@@ -0,0 +1,253 @@
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple, Optional
+from PySide6.QtSql import QSqlQuery
+from statements import StatementCache
+from combos import BUILD_COLUMNS, combo_stats_sql
+from ranking import ELO_START, ELO_K, elo_update
+from queries import search_filter, page_sql, notes_page_sql, count_sql, notes_match
+
+CHUNK_SIZE = 5000 # rows per transaction for bulk inserts
+BATCH_SIZE = 100 # rows per execBatch call, the QSQLITE driver emulates batches and gets slower than linear past a few hundred rows
+
+class RunRecord(NamedTuple): # one row of the runs table without its id, played_at is filled in by SQLite when a run is logged
+    build: int # packed, see combos.py
+    score: int
+    stage: Optional[int] = None # how far the run got
+    seconds: Optional[int] = None # how long it lasted
+    played_at: str = ''
+
+class LifeformRecord(NamedTuple): # one row of the lifeforms table without its id, everything but notes is a lookup code (see lookups.py)
+    life_form: int
+    main_shot: int
+    option_shot: int
+    clone_eyes: int
+    sp_weapon: int
+    rating: int
+    notes: str = ''
+
+INSERT_SQL = """
+    INSERT INTO lifeforms (life_form, main_shot, option_shot, clone_eyes, sp_weapon, rating, notes)
+    VALUES(?, ?, ?, ?, ?, ?, ?)
+    """
+UPDATE_SQL = "UPDATE lifeforms SET life_form = ?, main_shot = ?, option_shot = ?, clone_eyes = ?, sp_weapon = ?, rating = ?, notes = ? WHERE id = ?"
+DELETE_SQL = "DELETE FROM lifeforms WHERE id = ?"
+DELETE_ALL_SQL = "DELETE FROM lifeforms"
+GET_SQL = "SELECT * FROM lifeforms WHERE id = ?"
+TOTALS_COLUMNS = ('runs', 'rating_sum', 'bad', 'good', 'great')
+TOTALS_SQL = "SELECT " + ", ".join(f"sum({column})" for column in TOTALS_COLUMNS) + " FROM combo_stats"
+
+COMPARE_SQL = "INSERT INTO comparisons (winner, loser) VALUES (?, ?)"
+SCORE_SQL = "SELECT elo, comparisons FROM build_scores WHERE build = ?"
+SAVE_SCORE_SQL = """
+    INSERT INTO build_scores (build, elo, comparisons) VALUES (?, ?, ?)
+    ON CONFLICT (build) DO UPDATE SET elo = excluded.elo, comparisons = excluded.comparisons
+    """
+LOG_RUN_SQL = "INSERT INTO runs (build, score, stage, seconds) VALUES (?, ?, ?, ?)"
+RUN_COLUMNS = "id, build, score, stage, seconds, played_at" # RunRecord order after the id
+TOP_RUNS_SQL = f"SELECT {RUN_COLUMNS} FROM runs ORDER BY score DESC LIMIT ?" # walks idx_runs_score from the top
+RECENT_RUNS_SQL = f"SELECT {RUN_COLUMNS} FROM runs WHERE build = ? ORDER BY played_at DESC, id DESC LIMIT ?" # walks idx_runs_build_played_at backwards
+TOP_RUNS = 10
+RECENT_RUNS = 20
+
+SCORES_SQL = "SELECT build, elo, comparisons, strength FROM build_scores"
+COMPARISONS_SQL = "SELECT winner, loser FROM comparisons"
+SAVE_STRENGTH_SQL = "UPDATE build_scores SET strength = ? WHERE build = ?"
+
+class RepositoryError(Exception):
+    pass
+
+def value(query, column): # QSQLITE hands NULLs back as '', this turns them into None
+    return None if query.isNull(column) else query.value(column)
+
+class LifeformRepository: # data access for the lifeforms table that doesn't need any widgets, give it any open connection
+    # everything takes and gives back LifeformRecords (plus ids), so scripts and benchmarks can use it without the window
+    def __init__(self, database):
+        self.database = database
+        self.statements = StatementCache(database) # call close() before closing the connection
+
+    def close(self): # finishes the cached statements and lets go of the connection, so it can be closed and removed
+        self.statements.clear()
+        self.statements = None
+        self.database = None
+
+    def run(self, sql, values=()): # runs one cached statement, raises RepositoryError if it fails
+        query = self.statements.run(sql, values)
+        if not query.isActive():
+            raise RepositoryError(query.lastError().text())
+        return query
+
+    def rows(self, sql, values=()) -> Iterator[tuple[int, LifeformRecord]]: # (id, record) for every row a SELECT * FROM lifeforms style query returns
+        query = self.run(sql, values)
+        try:
+            while query.next():
+                codes = (value(query, column) for column in range(1, 7)) # a NULL code is None, NULL notes stay ''
+                yield query.value(0), LifeformRecord(*codes, query.value(7))
+        finally:
+            query.finish() # lets go of the read lock, the statement itself stays prepared
+
+    def add(self, record: LifeformRecord) -> int: # returns the new id
+        return self.run(INSERT_SQL, record).lastInsertId()
+
+    def update(self, id: int, record: LifeformRecord) -> None:
+        self.run(UPDATE_SQL, list(record) + [id])
+
+    def delete(self, id: int) -> None:
+        self.run(DELETE_SQL, [id])
+
+    def delete_all(self) -> None:
+        self.run(DELETE_ALL_SQL)
+
+    def get(self, id: int) -> Optional[LifeformRecord]:
+        for _, record in self.rows(GET_SQL, [id]):
+            return record
+        return None
+
+    def search(self, life_form: Optional[int] = None, rating: Optional[int] = None, notes: str = '',
+               limit: int = -1, after_id: int = 0, offset: int = 0) -> list[tuple[int, LifeformRecord]]:
+        # the same searches as the window, None means All/Any and -1 means no limit
+        # plain searches come back in id order starting after after_id, notes searches come back best match first starting at offset
+        where, values = search_filter(life_form, rating)
+        match = notes_match(notes)
+        if match:
+            return list(self.rows(notes_page_sql(where), [match] + values + [limit, offset]))
+        return list(self.rows(page_sql(where), values + [after_id, limit]))
+
+    def count(self, life_form: Optional[int] = None, rating: Optional[int] = None, notes: str = '') -> int:
+        where, values = search_filter(life_form, rating)
+        match = notes_match(notes)
+        if match:
+            values = [match] + values
+        query = self.run(count_sql(where, bool(match)), values)
+        query.next()
+        count = query.value(0)
+        query.finish()
+        return count
+
+    def combo_stats(self) -> Iterator[tuple[int, int, int, int]]: # (packed build, runs, rated runs, rating total) for every build tried, see combo_stats_sql in combos.py
+        query = self.run(combo_stats_sql())
+        try:
+            while query.next():
+                yield query.value(0), query.value(1), query.value(2), query.value(3)
+        finally:
+            query.finish()
+
+    def totals(self, life_form: Optional[int] = None, main_shot: Optional[int] = None, option_shot: Optional[int] = None,
+               clone_eyes: Optional[int] = None, sp_weapon: Optional[int] = None) -> dict[str, int]:
+        # runs, rating_sum and the bad/good/great counts added up over every build that matches, None matches any code
+        # e.g. totals(life_form=..., main_shot=...)['great'] reads a few hundred rows of combo_stats at most, never the runs
+        where = []
+        values = []
+        for column, code in zip(BUILD_COLUMNS, (life_form, main_shot, option_shot, clone_eyes, sp_weapon)):
+            if code is not None:
+                where.append(f"{column} = ?")
+                values.append(code)
+        sql = TOTALS_SQL + (" WHERE " + " AND ".join(where) if where else "")
+        query = self.run(sql, values)
+        query.next()
+        totals = {name: int(query.value(column) or 0) for column, name in enumerate(TOTALS_COLUMNS)}
+        query.finish()
+        return totals
+
+    def compare(self, winner: int, loser: int, k: float = ELO_K) -> tuple[float, float]:
+        # logs one head to head between two packed builds and moves both Elo scores, returns the new (winner, loser) scores
+        # two primary key lookups and three writes in one transaction, however many comparisons came before
+        self.database.transaction()
+        try:
+            scores = []
+            for build in (winner, loser):
+                query = self.run(SCORE_SQL, [build])
+                scores.append((query.value(0), query.value(1)) if query.next() else (ELO_START, 0))
+                query.finish()
+            (winner_elo, winner_comparisons), (loser_elo, loser_comparisons) = scores
+            winner_elo, loser_elo = elo_update(winner_elo, loser_elo, k)
+            self.run(COMPARE_SQL, [winner, loser])
+            self.run(SAVE_SCORE_SQL, [winner, winner_elo, winner_comparisons + 1])
+            self.run(SAVE_SCORE_SQL, [loser, loser_elo, loser_comparisons + 1])
+        except RepositoryError:
+            self.database.rollback()
+            raise
+        if not self.database.commit():
+            raise RepositoryError(f"Could not save the comparison: {self.database.lastError().text()}")
+        return winner_elo, loser_elo
+
+    def scores(self) -> list[tuple[int, float, int, Optional[float]]]: # (build, elo, comparisons, strength) for every build that's been compared
+        query = self.run(SCORES_SQL)
+        scores = []
+        while query.next():
+            scores.append((query.value(0), query.value(1), query.value(2), value(query, 3)))
+        query.finish()
+        return scores
+
+    def comparisons(self) -> Iterator[tuple[int, int]]: # (winner, loser) for every head to head, oldest first
+        query = self.run(COMPARISONS_SQL)
+        try:
+            while query.next():
+                yield query.value(0), query.value(1)
+        finally:
+            query.finish()
+
+    def save_strengths(self, strengths: Iterable[tuple[int, float]]) -> None: # (build, strength) pairs from a Bradley-Terry refit, in one transaction
+        self.database.transaction()
+        try:
+            for build, strength in strengths:
+                self.run(SAVE_STRENGTH_SQL, [strength, build])
+        except RepositoryError:
+            self.database.rollback()
+            raise
+        if not self.database.commit():
+            raise RepositoryError(f"Could not save the rankings: {self.database.lastError().text()}")
+
+    def log_run(self, run: RunRecord) -> int: # returns the new id, played_at is always now
+        return self.run(LOG_RUN_SQL, run[:4]).lastInsertId()
+
+    def run_rows(self, sql, values=()) -> list[tuple[int, RunRecord]]: # (id, run) for every row a SELECT {RUN_COLUMNS} FROM runs style query returns
+        query = self.run(sql, values)
+        runs = []
+        while query.next():
+            runs.append((query.value(0), RunRecord(*(value(query, column) for column in range(1, 6)))))
+        query.finish()
+        return runs
+
+    def top_runs(self, limit: int = TOP_RUNS) -> list[tuple[int, RunRecord]]: # the best scores of any build, best first
+        return self.run_rows(TOP_RUNS_SQL, [limit])
+
+    def recent_runs(self, build: int, limit: int = RECENT_RUNS) -> list[tuple[int, RunRecord]]: # the latest runs of one packed build, newest first
+        return self.run_rows(RECENT_RUNS_SQL, [build, limit])
+
+    def iterate(self, chunk_size: int = CHUNK_SIZE) -> Iterator[list[tuple[int, LifeformRecord]]]: # walks the whole table in id order a chunk at a time
+        last_id = 0
+        while True:
+            chunk = self.search(limit=chunk_size, after_id=last_id)
+            if not chunk:
+                return
+            yield chunk
+            last_id = chunk[-1][0]
+            if len(chunk) < chunk_size:
+                return
+
+    def add_many(self, records: Iterable[LifeformRecord], chunk_size: int = CHUNK_SIZE, progress=None) -> int: # inserts an iterable of records with execBatch, one transaction per chunk
+        query = QSqlQuery(self.database)
+        query.prepare(INSERT_SQL)
+        records = iter(records)
+        total = 0
+        while True:
+            chunk = list(islice(records, chunk_size)) # only one chunk is ever held in memory
+            if not chunk:
+                break
+
+            self.database.transaction()
+            for start in range(0, len(chunk), BATCH_SIZE):
+                # execBatch wants one list per placeholder, so each batch gets turned on its side
+                for column in zip(*chunk[start:start + BATCH_SIZE]):
+                    query.addBindValue(list(column))
+                if not query.execBatch():
+                    error = query.lastError().text()
+                    self.database.rollback()
+                    raise RepositoryError(f"Bulk insert failed after {total} rows: {error}")
+            if not self.database.commit():
+                raise RepositoryError(f"Could not commit the bulk insert after {total} rows: {self.database.lastError().text()}")
+
+            total += len(chunk)
+            if progress is not None and progress(total) is False: # returning False from progress stops after this chunk
+                break
+        return total
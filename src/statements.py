@@ -0,0 +1,49 @@
+from collections import OrderedDict
+from PySide6.QtSql import QSqlQuery
+
+STATEMENT_CACHE_SIZE = 32 # distinct statements kept prepared, the worker only ever uses a handful plus one page query per search filter
+
+class StatementCache: # keeps a prepared QSqlQuery per SQL string for one connection, so repeated statements skip the parse
+    def __init__(self, database, size=STATEMENT_CACHE_SIZE):
+        self.database = database
+        self.size = size
+        self.queries = OrderedDict() # sql -> prepared query, least recently used first
+        self.hits = 0
+        self.misses = 0
+
+    def query(self, sql, forward_only=True): # the prepared query for sql, preparing it only the first time it's asked for
+        query = self.queries.get(sql)
+        if query is not None:
+            self.hits += 1
+            self.queries.move_to_end(sql)
+            return query
+
+        self.misses += 1
+        query = QSqlQuery(self.database)
+        query.setForwardOnly(forward_only) # has to be set before prepare
+        if not query.prepare(sql):
+            return query # not cached, its lastError says why
+        self.queries[sql] = query
+        if len(self.queries) > self.size:
+            _, oldest = self.queries.popitem(last=False)
+            oldest.finish()
+        return query
+
+    def run(self, sql, values=()): # binds values by position on the cached query and runs it, returns the query either way so callers can check the error
+        query = self.query(sql)
+        if sql not in self.queries:
+            return query # the prepare failed
+        for position, value in enumerate(values):
+            query.bindValue(position, value)
+        query.exec()
+        return query
+
+    def clear(self): # has to happen before the connection is closed
+        for query in self.queries.values():
+            query.finish()
+        self.queries.clear()
+
+    def stats(self): # e.g. "12 hits, 3 misses (80% hit rate)"
+        total = self.hits + self.misses
+        rate = self.hits * 100 / total if total else 0
+        return f"{self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate)"
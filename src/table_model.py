@@ -0,0 +1,163 @@
+from array import array
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from lookups import label
+from queries import page_sql, notes_page_sql, notes_match
+
+PAGE_SIZE = 256 # rows pulled from the database each time the view scrolls near the bottom
+SAMPLE_ROWS = 32 # how many rows the header looks at when sizing columns to their contents
+
+HEADERS = ['ID', 'Life Form', 'Main Shot', 'Option Shot', 'Clone Eyes', 'Special Weapon', 'Rating', 'Notes']
+CODED_COLUMNS = 6 # life_form ... rating hold lookup codes, notes is the only text column
+MISSING = -1 # stands in for a NULL code in the byte arrays
+
+def new_columns(): # one signed byte per code for the coded columns, a plain list for the notes
+    return [array('b') for _ in range(CODED_COLUMNS)] + [[]]
+
+def pack(column, value): # what a value looks like inside the column arrays
+    if column < CODED_COLUMNS and value is None:
+        return MISSING
+    return value
+
+class LifeformTableModel(QAbstractTableModel): # holds the lifeforms table in column arrays and hands cells to the view on demand
+    page_requested = Signal(int, str, list) # generation, page sql, values to bind, answered by DatabaseWorker.fetch_page
+    first_page_loaded = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.fetching = False
+        self.sql = page_sql()
+        self.values = []
+        self.ranked = False
+        self.last_id = 0
+        self.more = False
+        self.ids = array('q') # the id column is packed as 64 bit ints instead of python objects
+        self.columns = new_columns() # one array per column after the id (life_form ... notes)
+        self.rows = {} # id -> row for the loaded rows, so an edit finds its row without scanning the ids
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        # the padding used to be baked into every QTableWidgetItem, now it's only built for the cells being painted
+        column = index.column() - 1
+        if column == -1:
+            return '  '+str(self.ids[index.row()])+'  '
+        value = self.columns[column][index.row()]
+        if column < CODED_COLUMNS:
+            value = label(column, value) # codes are turned into labels only when they're shown
+        return '  '+value+'  '
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def set_filter(self, where='', values=(), notes=''): # starts the table over on a new (optional) WHERE clause and notes search, and asks for the first page
+        self.beginResetModel()
+        self.generation += 1 # pages still on their way for the old filter get thrown away
+        self.ranked = bool(notes_match(notes))
+        if self.ranked: # notes searches come back best match first
+            self.sql = notes_page_sql(where)
+            self.values = [notes_match(notes)] + list(values)
+        else:
+            self.sql = page_sql(where)
+            self.values = list(values)
+        self.last_id = 0
+        self.more = True
+        self.fetching = False
+        self.ids = array('q')
+        self.columns = new_columns()
+        self.rows = {}
+        self.endResetModel()
+        self.request_page()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self.more and not self.fetching
+
+    def fetchMore(self, parent=QModelIndex()): # the view calls this when it scrolls near the bottom of what's loaded
+        if parent.isValid() or not self.canFetchMore():
+            return
+        self.request_page()
+
+    def request_page(self): # keyset pagination, the next page starts right after the last id we have instead of using OFFSET
+        self.fetching = True
+        if self.ranked:
+            page = [PAGE_SIZE, len(self.ids)]
+        else:
+            page = [self.last_id, PAGE_SIZE]
+        self.page_requested.emit(self.generation, self.sql, self.values + page)
+
+    def add_page(self, generation, page): # a page came back from the database worker
+        if generation != self.generation:
+            return
+        ids, columns, self.more = page
+        self.fetching = False
+        first = len(self.ids)
+        if ids:
+            self.last_id = ids[-1]
+            self.beginInsertRows(QModelIndex(), first, first + len(ids) - 1)
+            self.ids.extend(ids)
+            self.rows.update(zip(ids, range(first, first + len(ids))))
+            for column_values, values in zip(self.columns, columns):
+                column_values.extend(values)
+            self.endInsertRows()
+        if first == 0:
+            self.first_page_loaded.emit()
+
+    def clear(self):
+        self.beginResetModel()
+        self.generation += 1
+        self.more = False
+        self.fetching = False
+        self.ids = array('q')
+        self.columns = new_columns()
+        self.rows = {}
+        self.endResetModel()
+
+    def append_row(self, id, values): # adds one row to the bottom of the table without touching the others
+        if self.more or self.ranked:
+            return # the row has the highest id so it will show up when its page gets fetched (notes searches are sorted by rank instead)
+        row = len(self.ids)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.ids.append(id)
+        self.rows[id] = row
+        for column, (column_values, value) in enumerate(zip(self.columns, values)):
+            column_values.append(pack(column, value))
+        self.endInsertRows()
+
+    def update_row(self, row, values): # swaps the values of one row and repaints just that row
+        for column, (column_values, value) in enumerate(zip(self.columns, values)):
+            column_values[row] = pack(column, value)
+        self.dataChanged.emit(self.index(row, 1), self.index(row, len(HEADERS) - 1))
+
+    def remove_row(self, row): # the rows below move up one, so they're the only ones that get renumbered
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[self.ids[row]]
+        del self.ids[row]
+        for column_values in self.columns:
+            del column_values[row]
+        for later in range(row, len(self.ids)):
+            self.rows[self.ids[later]] = later
+        self.endRemoveRows()
+
+    def row_of(self, id): # where a row with this id sits in the table, or -1 if it isn't loaded
+        return self.rows.get(id, -1)
+
+    def row_id(self, row):
+        return self.ids[row]
+
+    def row_values(self, row): # the codes and notes for a row, in table column order without the id
+        return tuple(None if column < CODED_COLUMNS and values[row] == MISSING else values[row] for column, values in enumerate(self.columns))
@@ -0,0 +1,171 @@
+from array import array
+import time
+import numpy as np
+from PySide6.QtCore import QObject, Signal, Slot
+from table_model import new_columns, pack, PAGE_SIZE
+from repository import LifeformRepository, RepositoryError
+from ratings import RatingStats
+from ranking import BuildRanking, bradley_terry
+from combos import BUILDS
+from pragmas import Connection, OpenError, apply_profile, profile_name, DEFAULT_PROFILE
+
+CONNECTION_NAME = "worker" # Qt connections can't be shared between threads, so the worker opens its own
+
+class DatabaseWorker(QObject): # runs a LifeformRepository for the main window on a QThread so the window never waits on the disk
+    page_ready = Signal(int, object) # generation, (ids, columns, more) for the table model
+    added = Signal(int, object) # id, LifeformRecord
+    updated = Signal(int, object) # id, LifeformRecord
+    removed = Signal(int) # id
+    cleared = Signal()
+    failed = Signal(str)
+    profile_applied = Signal(str, object) # profile, {pragma: value} as SQLite reports them
+    stats_ready = Signal(object, object) # rows per packed build for the coverage index, RatingStats for the heatmaps
+    compared = Signal(int, int, float, float) # winner, loser, their new Elo scores
+    rankings_ready = Signal(object) # BuildRanking
+    refitted = Signal(int, float) # comparisons used, seconds
+    run_logged = Signal(int, object) # id, RunRecord
+    runs_ready = Signal(int, object, object) # packed build, [(id, RunRecord)] best scores overall, [(id, RunRecord)] latest runs of the build
+
+    def __init__(self, database_file, profile=DEFAULT_PROFILE):
+        super().__init__()
+        self.profile = profile_name(profile)
+        self.connection = Connection(database_file, CONNECTION_NAME, self.profile)
+        self.repository = None
+
+    @Slot()
+    def open(self): # runs once the worker is on its thread, so the connection belongs to that thread
+        try:
+            self.connection.open()
+        except OpenError as error:
+            self.failed.emit(f"Could not open your database\n{error}")
+            return
+        self.repository = LifeformRepository(self.connection.database) # all the SQL is in there, the worker just moves it off the GUI thread
+        self.profile_applied.emit(self.profile, self.connection.pragmas)
+
+    @Slot(str)
+    def set_profile(self, profile): # Settings -> Database, takes effect on this connection straight away
+        self.profile = profile_name(profile)
+        self.profile_applied.emit(self.profile, apply_profile(self.connection.database, self.profile))
+
+    @Slot()
+    def close(self):
+        if self.repository is not None:
+            self.repository.close()
+            self.repository = None
+        self.connection.close()
+
+    @Slot(int, str, list)
+    def fetch_page(self, generation, sql, values): # one page for the table model, packed into column arrays here so the GUI thread only has to extend
+        ids = array('q')
+        columns = new_columns()
+        try:
+            for id, record in self.repository.rows(sql, values):
+                ids.append(id)
+                for column, (column_values, value) in enumerate(zip(columns, record)):
+                    column_values.append(pack(column, value))
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        self.page_ready.emit(generation, (ids, columns, len(ids) == PAGE_SIZE))
+
+    @Slot(object)
+    def add(self, record):
+        try:
+            id = self.repository.add(record)
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        self.added.emit(id, record)
+
+    @Slot(int, object)
+    def update(self, id, record):
+        try:
+            self.repository.update(id, record)
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        self.updated.emit(id, record)
+
+    @Slot(int)
+    def remove(self, id):
+        try:
+            self.repository.delete(id)
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        self.removed.emit(id)
+
+    @Slot()
+    def remove_all(self):
+        try:
+            self.repository.delete_all()
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        self.cleared.emit()
+
+    @Slot()
+    def load_stats(self): # reads the per build totals once at startup (and after an import), the window keeps them up to date from there
+        try:
+            totals = np.array(list(self.repository.combo_stats()), dtype=np.int64).reshape(-1, 4) # at most one row per build, however long the log is
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        builds, runs, rated, sums = totals.T
+        stats = RatingStats()
+        stats.load(builds, rated, sums)
+        self.stats_ready.emit(np.bincount(builds, weights=runs, minlength=BUILDS).astype(np.int64), stats)
+
+    @Slot(int, int)
+    def compare(self, winner, loser): # one head to head result, an O(1) Elo update, see LifeformRepository.compare
+        try:
+            winner_elo, loser_elo = self.repository.compare(winner, loser)
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        self.compared.emit(winner, loser, winner_elo, loser_elo)
+
+    @Slot()
+    def load_rankings(self):
+        ranking = BuildRanking()
+        try:
+            ranking.load(self.repository.scores())
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        self.rankings_ready.emit(ranking)
+
+    @Slot()
+    def refit_rankings(self): # Bradley-Terry over every comparison ever made, saved next to the Elo scores, then sent back like load_rankings
+        start = time.perf_counter()
+        try:
+            pairs = np.array(list(self.repository.comparisons()), dtype=np.int64).reshape(-1, 2)
+            if len(pairs):
+                strengths = bradley_terry(pairs[:, 0], pairs[:, 1])
+                compared = np.flatnonzero(~np.isnan(strengths))
+                self.repository.save_strengths(zip(compared.tolist(), strengths[compared].tolist()))
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        self.refitted.emit(len(pairs), time.perf_counter() - start)
+        self.load_rankings()
+
+    @Slot(object)
+    def log_run(self, run): # a RunRecord, answered with run_logged and then the fresh runs for its build
+        try:
+            id = self.repository.log_run(run)
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        self.run_logged.emit(id, run)
+        self.load_runs(run.build)
+
+    @Slot(int)
+    def load_runs(self, build): # two index walks, see TOP_RUNS_SQL and RECENT_RUNS_SQL in repository.py
+        try:
+            top = self.repository.top_runs()
+            recent = self.repository.recent_runs(build)
+        except RepositoryError as error:
+            self.failed.emit(str(error))
+            return
+        self.runs_ready.emit(build, top, recent)